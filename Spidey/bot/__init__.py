@@ -33,7 +33,6 @@ class SpideyxBot(Client):
             api_hash=API_HASH,
             bot_token=BOT_TOKEN,
             workers=50,
-            plugins={"root": "plugins"},
             sleep_threshold=5,
         )
     async def start(self):
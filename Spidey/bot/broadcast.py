@@ -0,0 +1,471 @@
+import time
+import asyncio
+import logging
+from datetime import datetime
+from collections import Counter, OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pyrogram import Client
+from pyrogram.errors import FloodWait
+from pyrogram.types import Message, InlineKeyboardButton, InlineKeyboardMarkup
+
+from info import LOG_CHANNEL, MULTI_BROADCAST, BROADCAST_WORKERS, BROADCAST_RATE, BROADCAST_PROGRESS_TIME
+from database.users_chats_db import db
+from utils import users_broadcast, groups_broadcast, get_readable_time
+from Spidey.bot import multi_clients
+
+logger = logging.getLogger(__name__)
+
+
+def broadcast_clients(bot: Client) -> List[Client]:
+    """The bots a broadcast goes out from, the main bot first."""
+    if not MULTI_BROADCAST:
+        return [bot]
+    return [bot] + [client for client in multi_clients.values() if client is not bot]
+
+
+async def broadcast_source(message: Message, clients: List[Client]) -> Message:
+    """The message every client copies from. The helper bots can't read the admin's chat
+    with the main bot, so with more than one client it goes through LOG_CHANNEL first."""
+    if len(clients) == 1:
+        return message
+    return await message.copy(LOG_CHANNEL)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Paces API calls to `rate` per second, shared by every task sending through one bot.
+        attributes:
+            capacity: the burst allowed after an idle period, one second worth by default.
+            paused_until: time.monotonic() before which nothing is sent, set by `pause`
+                when Telegram answers with a FloodWait.
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    async def acquire(self, amount: float = 1) -> None:
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        # One FloodWait stops every worker, they'd all hit the same limit otherwise
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
+# One bucket per bot, shared by every broadcast it sends, two jobs must not each get the full rate
+limiters: Dict[Client, TokenBucket] = {}
+
+
+def client_limiter(client: Client, rate: float) -> TokenBucket:
+    limiter = limiters.get(client)
+    if limiter is None:
+        limiter = limiters[client] = TokenBucket(rate)
+    return limiter
+
+
+class Broadcast:
+    def __init__(self, send: Callable[[Client, int], Awaitable[str]], clients: List[Client], workers: int,
+                 rate: float, cost: int = 1, record: Optional[Callable[[int, str], None]] = None):
+        """Sends one message to many chats through every bot sharing the audience.
+        attributes:
+            send: coroutine taking a client and a chat id and returning a status such as
+                "Success", FloodWait is left to propagate so that client can back off.
+            clients: the bots sending, each runs `workers` workers behind its own limiter.
+            limiters: the shared TokenBucket of each client, a FloodWait only pauses the bot that got it.
+            cost: API calls one send makes, 2 when the message also gets pinned.
+            record: called with every chat id and its status once it's handled.
+            stats: the number of chats per status, over all clients.
+            sent: the number of chats each client handled, by position in `clients`.
+            done: chats handled so far.
+            flood_waits: FloodWaits received.
+
+        functions:
+            run: sends to every chat id from an async iterator, calling `progress` every
+                `interval` seconds.
+            cancel: stops handing out new chats.
+        """
+        self.send = send
+        self.clients = clients
+        self.workers = workers
+        self.limiters = [client_limiter(client, rate) for client in clients]
+        self.cost = cost
+        self.record = record
+        self.stats = Counter()
+        self.sent = Counter()
+        self.done = 0
+        self.flood_waits = 0
+        self.cancelled = False
+        self.started = time.time()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def shares(self) -> str:
+        """Chats handled by each bot, like "1204 / 1187 / 1215"."""
+        return " / ".join(str(self.sent[index]) for index in range(len(self.clients)))
+
+    async def run(self, chat_ids: AsyncIterator[int], progress: Optional[Callable[["Broadcast"], Awaitable]] = None,
+                  interval: float = 10) -> "Broadcast":
+        queue = asyncio.Queue(maxsize=self.workers * len(self.clients) * 2)
+        workers = [
+            asyncio.create_task(self.worker(index, queue))
+            for index in range(len(self.clients)) for _ in range(self.workers)
+        ]
+        reporter = asyncio.create_task(self.report(progress, interval)) if progress else None
+        try:
+            async for chat_id in chat_ids:
+                if self.cancelled:
+                    break
+                await queue.put(chat_id)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            if reporter:
+                reporter.cancel()
+            # Wait them out, a checkpoint cut short hands its batch back before the caller's final one
+            await asyncio.gather(*workers, *([reporter] if reporter else []), return_exceptions=True)
+        return self
+
+    async def worker(self, index: int, queue: asyncio.Queue) -> None:
+        while True:
+            # Take a token before a chat, a bot sitting out a FloodWait leaves the queue to the others
+            await self.limiters[index].acquire(self.cost)
+            chat_id = await queue.get()
+            if chat_id is None:
+                return
+            if self.cancelled:
+                continue
+            status = await self.deliver(index, chat_id)
+            self.stats[status] += 1
+            self.sent[index] += 1
+            self.done += 1
+            if self.record:
+                self.record(chat_id, status)
+
+    async def deliver(self, index: int, chat_id: int) -> str:
+        while True:
+            try:
+                return await self.send(self.clients[index], chat_id)
+            except FloodWait as e:
+                self.flood_waits += 1
+                self.limiters[index].pause(e.value)
+                await self.limiters[index].acquire(self.cost)
+            except Exception as e:
+                logger.error(f"Broadcast to {chat_id} failed: {e}")
+                return "Error"
+
+    async def report(self, progress: Callable[["Broadcast"], Awaitable], interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await progress(self)
+            except FloodWait as e:
+                await asyncio.sleep(e.value)
+            except Exception:
+                pass
+
+
+# The states a job record moves through
+RUNNING, PAUSED, CANCELLED, DONE = "running", "paused", "cancelled", "done"
+# Statuses that mean the chat can't be reached anymore, removed at each checkpoint
+DEAD = {'users': ("Blocked", "Deleted", "Invalid"), 'groups': ("Left",)}
+
+
+class BroadcastRun:
+    def __init__(self, job: dict, bot: Client):
+        """One pass over a stored job, from its cursor until it ends, pauses or gets cancelled.
+        attributes:
+            cursor: the recipient _id up to which every chat was handled, recipients are
+                read from db.col or db.grp in _id order.
+            pending: recipient _id -> [chat id, handled] past the cursor, in _id order.
+            index: chat id -> recipient _id of the chats handed to the engine.
+            ahead: chat ids an earlier pass handled past its cursor, skipped this time.
+            results: status -> chat ids handled since the last checkpoint.
+            dead: chat ids already logged whose removal hasn't gone through yet.
+        """
+        self.job = job
+        self.bot = bot
+        self.collection = db.col if job['kind'] == 'users' else db.grp
+        self.cursor = job.get('cursor')
+        self.pending: "OrderedDict[ObjectId, list]" = OrderedDict()
+        self.index: Dict[int, ObjectId] = {}
+        self.ahead = set(job.get('ahead', []))
+        self.results: Dict[str, List[int]] = {}
+        self.dead: List[int] = []
+        self.skipped = 0
+        self.engine: Optional[Broadcast] = None
+
+    async def recipients(self) -> AsyncIterator[int]:
+        query = {'_id': {'$gt': self.cursor}} if self.cursor is not None else {}
+        async for recipient in self.collection.find(query, {'id': 1}).sort('_id', 1):
+            chat_id = int(recipient['id'])
+            if chat_id in self.ahead or chat_id in self.index:
+                # Handled by an earlier pass, or a duplicate of a chat in flight
+                if chat_id in self.index:
+                    self.skipped += 1
+                self.ahead.discard(chat_id)
+                self.pending[recipient['_id']] = [chat_id, True]
+                self.advance()
+                continue
+            self.pending[recipient['_id']] = [chat_id, False]
+            self.index[chat_id] = recipient['_id']
+            yield chat_id
+
+    def record(self, chat_id: int, status: str) -> None:
+        self.pending[self.index.pop(chat_id)][1] = True
+        self.results.setdefault(status, []).append(chat_id)
+        self.advance()
+
+    def advance(self) -> None:
+        while self.pending:
+            id, (chat_id, handled) = next(iter(self.pending.items()))
+            if not handled:
+                break
+            self.pending.popitem(last=False)
+            self.cursor = id
+
+    def stats(self) -> Counter:
+        stats = Counter(self.job.get('stats', {}))
+        if self.engine:
+            stats.update(self.engine.stats)
+        return stats
+
+    def done(self) -> int:
+        return self.job.get('done', 0) + self.skipped + (self.engine.done if self.engine else 0)
+
+    async def checkpoint(self) -> None:
+        """Stores the cursor, the counts and one batch with the status of every chat since the last call,
+        then removes the dead chats of that batch with one delete."""
+        results, self.results = self.results, {}
+        try:
+            if results:
+                await db.broadcast_log.insert_one({'job': self.job['_id'], 'at': datetime.utcnow(), 'results': results})
+        except BaseException:
+            # Cancelled with the reporter or failed, hand the batch to the next checkpoint
+            for status, chat_ids in results.items():
+                self.results.setdefault(status, []).extend(chat_ids)
+            raise
+        self.dead.extend(chat_id for status in DEAD[self.job['kind']] for chat_id in results.get(status, []))
+        dead, self.dead = self.dead, []
+        if dead:
+            try:
+                await (db.delete_users(dead) if self.job['kind'] == 'users' else db.delete_chats(dead))
+            except asyncio.CancelledError:
+                self.dead.extend(dead)
+                raise
+            except Exception as e:
+                logger.error(f"Failed to remove {len(dead)} dead chats: {e}")
+        ahead = [chat_id for chat_id, handled in self.pending.values() if handled] + list(self.ahead)
+        await db.broadcasts.update_one({'_id': self.job['_id']}, {'$set': {
+            'cursor': self.cursor, 'ahead': ahead, 'stats': dict(self.stats()), 'done': self.done(),
+        }})
+
+    async def tick(self, engine: "Broadcast") -> None:
+        await self.checkpoint()
+        job = await db.broadcasts.find_one({'_id': self.job['_id']}, {'status': 1})
+        if job is None or job['status'] != RUNNING:
+            engine.cancel()
+            return
+        await self.edit(RUNNING)
+
+    def text(self, state: str) -> str:
+        job = self.job
+        stats = self.stats()
+        time_taken = get_readable_time(time.time() - job['started'])
+        if job['kind'] == 'users':
+            kind = "Users"
+            counts = f"Total Users: <code>{job['total']}</code>\nCompleted: <code>{self.done()} / {job['total']}</code>\nSuccess: <code>{stats['Success']}</code>\nBlocked: <code>{stats['Blocked']}</code>\nDeleted: <code>{stats['Deleted']}</code>\nFailed: <code>{stats['Error'] + stats['Invalid']}</code>"
+        else:
+            kind = "Groups"
+            counts = f"Total Groups: <code>{job['total']}</code>\nCompleted: <code>{self.done()} / {job['total']}</code>\nSuccess: <code>{stats['Success']}</code>\nRemoved: <code>{stats['Left']}</code>\nFailed: <code>{stats['Error']}</code>"
+        if self.engine and len(self.engine.clients) > 1:
+            counts += f"\nBots: <code>{self.engine.shares()}</code>"
+        heading = {
+            RUNNING: f"{kind} broadcast in progress...",
+            PAUSED: f"{kind} broadcast paused.",
+            CANCELLED: f"{kind} broadcast Cancelled!\nCompleted in {time_taken}",
+            DONE: f"{kind} broadcast completed.\nCompleted in {time_taken}",
+        }[state]
+        return f"{heading}\n\n{counts}"
+
+    def buttons(self, state: str) -> Optional[InlineKeyboardMarkup]:
+        id = self.job['_id']
+        if state == RUNNING:
+            return InlineKeyboardMarkup([[
+                InlineKeyboardButton('PAUSE', callback_data=f'broadcast#{PAUSED}#{id}'),
+                InlineKeyboardButton('CANCEL', callback_data=f'broadcast#{CANCELLED}#{id}')
+            ]])
+        if state == PAUSED:
+            return InlineKeyboardMarkup([[
+                InlineKeyboardButton('RESUME', callback_data=f'broadcast#{RUNNING}#{id}'),
+                InlineKeyboardButton('CANCEL', callback_data=f'broadcast#{CANCELLED}#{id}')
+            ]])
+        return None
+
+    async def edit(self, state: str) -> None:
+        try:
+            await self.bot.edit_message_text(self.job['status_chat'], self.job['status_id'], self.text(state), reply_markup=self.buttons(state))
+        except Exception:
+            pass
+
+    async def run(self) -> str:
+        """Sends until the job ends or its record leaves RUNNING, returns the state it ended in."""
+        job = self.job
+        message = await self.bot.get_messages(job['chat_id'], job['message_id'])
+        if not message or message.empty:
+            await db.broadcasts.update_one({'_id': job['_id']}, {'$set': {'status': CANCELLED}})
+            await self.edit(CANCELLED)
+            return CANCELLED
+        clients = broadcast_clients(self.bot)
+        if job['chat_id'] != LOG_CHANNEL:
+            # Stored before MULTI_BROADCAST was turned on, only the main bot can read it
+            clients = clients[:1]
+        # Every bot fetches the source once, Message.copy then costs one call per recipient
+        # where copy_message would fetch it again for each of them
+        sources = {self.bot: message}
+        for client in clients[1:]:
+            try:
+                source = await client.get_messages(job['chat_id'], job['message_id'])
+            except Exception as e:
+                logger.error(f"Broadcast {job['_id']} can't use a helper bot: {e}")
+                continue
+            if source and not source.empty:
+                sources[client] = source
+        clients = [client for client in clients if client in sources]
+        send = users_broadcast if job['kind'] == 'users' else groups_broadcast
+        cost = 2 if job['is_pin'] else 1
+
+        async def deliver(client, chat_id):
+            status = await send(chat_id, sources[client], job['is_pin'])
+            if status in DEAD[job['kind']] and client is not self.bot:
+                # A helper bot the user never started, only the main bot's answer means the chat is dead.
+                # The retry is paced and backed off by the main bot's limiter, not the helper's
+                main = self.engine.limiters[0]
+                while True:
+                    await main.acquire(cost)
+                    try:
+                        return await send(chat_id, message, job['is_pin'])
+                    except FloodWait as e:
+                        self.engine.flood_waits += 1
+                        main.pause(e.value)
+            return status
+
+        self.engine = Broadcast(deliver, clients,
+                                BROADCAST_WORKERS, BROADCAST_RATE, cost=cost, record=self.record)
+        await self.engine.run(self.recipients(), self.tick, BROADCAST_PROGRESS_TIME)
+        await self.checkpoint()
+        if self.engine.cancelled:
+            state = (await db.broadcasts.find_one({'_id': job['_id']}, {'status': 1}))['status']
+        else:
+            state = DONE
+            await db.broadcasts.update_one({'_id': job['_id']}, {'$set': {'status': DONE, 'ahead': []}})
+        if state != RUNNING:
+            await self.edit(state)
+        return state
+
+
+class BroadcastJobs:
+    def __init__(self):
+        """Broadcasts stored in db.broadcasts, so a restart resumes them instead of starting over.
+        attributes:
+            running: job _id -> the BroadcastRun sending it right now.
+
+        functions:
+            start: resumes the jobs a restart interrupted.
+            busy: tells whether a job is running or paused, a new one has to wait for it.
+            create: stores a new job and starts sending it.
+            set_status: pauses, resumes or cancels a job through its record.
+        """
+        self.running: Dict[ObjectId, BroadcastRun] = {}
+        self.bot = None
+
+    async def start(self, bot: Client) -> None:
+        self.bot = bot
+        async for job in db.broadcasts.find({'status': RUNNING}):
+            self.launch(job)
+        if self.running:
+            logger.info(f"Resumed {len(self.running)} broadcasts")
+
+    def launch(self, job: dict) -> None:
+        run = self.running[job['_id']] = BroadcastRun(job, self.bot)
+        asyncio.create_task(self.watch(run))
+
+    async def watch(self, run: BroadcastRun) -> None:
+        try:
+            state = await run.run()
+        except Exception:
+            logger.exception(f"Broadcast {run.job['_id']} stopped")
+            # Left as running it would resume on the next boot without a word to the admin
+            try:
+                await db.broadcasts.update_one({'_id': run.job['_id'], 'status': RUNNING}, {'$set': {'status': PAUSED}})
+                await run.edit(PAUSED)
+            except Exception as e:
+                logger.error(f"Failed to pause broadcast {run.job['_id']}: {e}")
+            return
+        finally:
+            self.running.pop(run.job['_id'], None)
+        if state == RUNNING:
+            # Resumed while this pass was still winding down from a pause
+            self.launch(await db.broadcasts.find_one({'_id': run.job['_id']}))
+
+    async def busy(self) -> bool:
+        # The records, not self.running, a paused job isn't running but would share the bots once resumed
+        return await db.broadcasts.find_one({'status': {'$in': [RUNNING, PAUSED]}}, {'_id': 1}) is not None
+
+    async def create(self, kind: str, message: Message, is_pin: bool, status_message: Message) -> None:
+        source = await broadcast_source(message, broadcast_clients(self.bot))
+        total = await db.total_users_count() if kind == 'users' else await db.total_chat_count()
+        job = {
+            'kind': kind,
+            'chat_id': source.chat.id,
+            'message_id': source.id,
+            'is_pin': is_pin,
+            'status': RUNNING,
+            'total': total,
+            'status_chat': status_message.chat.id,
+            'status_id': status_message.id,
+            'started': time.time(),
+        }
+        job['_id'] = (await db.broadcasts.insert_one(job)).inserted_id
+        self.launch(job)
+
+    async def set_status(self, job_id: str, status: str) -> Optional[dict]:
+        """Moves a running or paused job to `status`, returns None when it already ended."""
+        job = await db.broadcasts.find_one_and_update(
+            {'_id': ObjectId(job_id), 'status': {'$in': [RUNNING, PAUSED]}},
+            {'$set': {'status': status}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if job is None:
+            return None
+        run = self.running.get(job['_id'])
+        if run is not None:
+            # The pass notices the record on its next tick, this only saves the wait
+            if status != RUNNING and run.engine:
+                run.engine.cancel()
+        elif status == RUNNING:
+            self.launch(job)
+        else:
+            await BroadcastRun(job, self.bot).edit(status)
+        return job
+
+
+broadcast_jobs = BroadcastJobs()
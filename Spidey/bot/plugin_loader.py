@@ -0,0 +1,164 @@
+import ast
+import time
+import logging
+import importlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pyrogram import filters
+from pyrogram.handlers import MessageHandler
+from pyrogram.handlers.handler import Handler
+
+logger = logging.getLogger(__name__)
+
+
+def module_handlers(module) -> List[Tuple[Handler, int]]:
+    """The (handler, group) pairs pyrogram's decorators left on a module's functions."""
+    found = []
+    for name in vars(module).keys():
+        try:
+            for handler, group in getattr(module, name).handlers:
+                if isinstance(handler, Handler) and isinstance(group, int):
+                    found.append((handler, group))
+        except Exception:
+            pass
+    return found
+
+
+def _command(node: ast.AST) -> Optional[Tuple[list, list]]:
+    """The commands and prefixes a filter expression can't match without, None if there are none."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+        return _command(node.left) or _command(node.right)
+    if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "command"):
+        return None
+    arguments = dict(zip(("commands", "prefixes"), node.args))
+    arguments.update((keyword.arg, keyword.value) for keyword in node.keywords)
+    try:
+        commands = ast.literal_eval(arguments["commands"])
+        prefixes = ast.literal_eval(arguments["prefixes"]) if "prefixes" in arguments else "/"
+    except (KeyError, ValueError):
+        return None
+    commands = [commands] if isinstance(commands, str) else list(commands)
+    prefixes = [prefixes] if isinstance(prefixes, str) else list(prefixes)
+    return commands, prefixes
+
+
+def command_triggers(path: Path) -> Optional[List[Tuple[list, list]]]:
+    """Returns the commands behind every handler of a plugin, read from its source without importing it.
+
+    An empty list means a helper module without handlers. None means the plugin can't
+    wait for a command: it has a handler for callbacks, join requests or plain messages,
+    a handler in another group, or a command list built at runtime.
+    """
+    triggers = []
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)
+                    and decorator.func.attr.startswith("on_")):
+                continue
+            if decorator.func.attr != "on_message" or len(decorator.args) != 1 or decorator.keywords:
+                return None
+            trigger = _command(decorator.args[0])
+            if trigger is None:
+                return None
+            triggers.append(trigger)
+    return triggers
+
+
+class LazyPlugin(MessageHandler):
+    def __init__(self, registry: "PluginRegistry", name: str, triggers: List[Tuple[list, list]]):
+        """Stands in for a deferred plugin in group 0, where its own handlers would sit.
+        The plugin is imported the first time one of its commands arrives, after that
+        updates go to the plugin's handlers in their original order, so a command
+        whose handler doesn't match still falls through to the rest of the group.
+        """
+        trigger = filters.command(*triggers[0])
+        for commands, prefixes in triggers[1:]:
+            trigger = trigger | filters.command(commands, prefixes)
+        super().__init__(self.dispatch, trigger)
+        self.registry = registry
+        self.name = name
+        self.handlers: Optional[List[Handler]] = None
+
+    async def match(self, client, message) -> Optional[Handler]:
+        for handler in self.handlers:
+            if await handler.check(client, message):
+                return handler
+        return None
+
+    async def check(self, client, message) -> bool:
+        if not await super().check(client, message):
+            return False
+        if self.handlers is None:
+            self.handlers = self.registry.import_deferred(self.name)
+        return await self.match(client, message) is not None
+
+    async def dispatch(self, client, message):
+        handler = await self.match(client, message)
+        if handler is not None:
+            await handler.callback(client, message)
+
+
+class PluginRegistry:
+    def __init__(self, root: str = "plugins", deferred_packages: Tuple[str, ...] = ("Extra",)):
+        """Imports every plugin module once and registers its handlers on the bot.
+        attributes:
+            root: the package holding the plugins.
+            deferred_packages: sub packages whose command only plugins wait for their first command.
+            timings: module -> seconds its import took, including anything it imported first.
+            deferred: modules not imported yet.
+
+        functions:
+            load: imports the plugins and registers their handlers, in pyrogram's load order.
+            report: logs the import cost of every module, slowest first.
+        """
+        self.root = root
+        self.deferred_packages = deferred_packages
+        self.timings: Dict[str, float] = {}
+        self.deferred: Dict[str, LazyPlugin] = {}
+
+    def load(self, client, lazy: bool = True) -> None:
+        for path in sorted(Path(self.root.replace(".", "/")).rglob("*.py")):
+            if path.stem == "__init__":
+                continue
+            name = ".".join(path.parent.parts + (path.stem,))
+            triggers = command_triggers(path) if lazy and self.is_deferrable(path) else None
+            if triggers is not None:
+                # Helpers without handlers get imported by the plugins that use them
+                if triggers:
+                    self.deferred[name] = LazyPlugin(self, name, triggers)
+                    client.add_handler(self.deferred[name], 0)
+                continue
+            try:
+                module = self.import_module(name)
+            except Exception:
+                logger.exception(f"Failed to import plugin {name}")
+                continue
+            for handler, group in module_handlers(module):
+                client.add_handler(handler, group)
+
+    def is_deferrable(self, path: Path) -> bool:
+        parts = path.relative_to(self.root.replace(".", "/")).parts
+        return len(parts) > 1 and parts[0] in self.deferred_packages
+
+    def import_module(self, name: str):
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self.timings[name] = time.perf_counter() - start
+        return module
+
+    def import_deferred(self, name: str) -> List[Handler]:
+        module = self.import_module(name)
+        del self.deferred[name]
+        logger.info(f"Imported {name} on its first command in {self.timings[name] * 1000:.1f} ms")
+        return [handler for handler, group in module_handlers(module)]
+
+    def report(self) -> None:
+        total = sum(self.timings.values())
+        lines = [f"{seconds * 1000:8.1f} ms  {name}" for name, seconds in sorted(self.timings.items(), key=lambda item: item[1], reverse=True)]
+        logger.info(f"Imported {len(self.timings)} plugins in {total:.2f}s, {len(self.deferred)} deferred until their first command:\n" + "\n".join(lines))
+
+
+plugins = PluginRegistry()
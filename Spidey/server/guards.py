@@ -2,16 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable
 
 from pyrogram import Client
 
 # Use the new modular DB adapter for verification status
 from handlers import db_adapter as db
-
-# Simple in-memory cache to reduce DB hits
-_VERIFY_CACHE: Dict[int, Tuple[bool, float]] = {}
-_VERIFY_TTL = 60.0  # seconds
+# The answer is kept in the shared user status cache, verifying drops it
+from database.users_chats_db import db as users_db
+from info import VERIFY_GUARD_CACHE_TIME
 
 
 def _is_private_chat(chat_id: Any) -> bool:
@@ -30,14 +29,14 @@ async def ensure_verified(client: Client, chat_id: Any) -> bool:
 	user_id = int(chat_id)
 	
 	# Cache first
-	cached = _VERIFY_CACHE.get(user_id)
-	now = time.time()
-	if cached and now - cached[1] < _VERIFY_TTL:
+	status = users_db.user_status(user_id)
+	cached = status.get("guard")
+	if cached and cached[1] > time.monotonic():
 		return cached[0]
 	
 	try:
 		ok = await db.is_user_verified(user_id)
-		_VERIFY_CACHE[user_id] = (ok, now)
+		status["guard"] = (ok, time.monotonic() + VERIFY_GUARD_CACHE_TIME)
 		if ok:
 			return True
 		# Block and notify
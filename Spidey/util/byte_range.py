@@ -0,0 +1,91 @@
+from typing import List, Optional, Tuple
+
+# upload.GetFile rules: offset and limit are multiples of 4 KiB, 1 MiB is a
+# multiple of limit and a request never crosses a 1 MiB boundary.
+MIN_CHUNK_SIZE = 4 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+MAX_RANGES = 16
+
+
+class RangeNotSatisfiable(Exception):
+    message = "Range not satisfiable"
+
+
+def parse_range_header(range_header: str, file_size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parses a `Range` header into a list of inclusive (from_bytes, until_bytes) pairs.
+    Handles `a-b`, open ended `a-` and suffix `-n` specs as well as several specs
+    separated by commas. Overlapping or adjacent ranges are merged.
+    Returns None when the header should be ignored and the whole file served,
+    raises RangeNotSatisfiable when no spec overlaps the file.
+    """
+    unit, _, specs = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs.strip():
+        return None
+
+    ranges = []
+    for spec in specs.split(","):
+        spec = spec.strip()
+        if not spec:
+            continue
+        start, sep, end = spec.partition("-")
+        start, end = start.strip(), end.strip()
+        if not sep or not (start or end):
+            return None
+        if (start and not start.isdigit()) or (end and not end.isdigit()):
+            return None
+        if not start:
+            suffix = int(end)
+            if suffix == 0:
+                continue
+            from_bytes, until_bytes = max(file_size - suffix, 0), file_size - 1
+        else:
+            from_bytes = int(start)
+            until_bytes = int(end) if end else file_size - 1
+            if until_bytes < from_bytes:
+                return None
+            if from_bytes >= file_size:
+                continue
+            until_bytes = min(until_bytes, file_size - 1)
+        ranges.append((from_bytes, until_bytes))
+
+    if not ranges:
+        raise RangeNotSatisfiable
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for from_bytes, until_bytes in ranges[1:]:
+        last_from, last_until = merged[-1]
+        if from_bytes <= last_until + 1:
+            merged[-1] = (last_from, max(last_until, until_bytes))
+        else:
+            merged.append((from_bytes, until_bytes))
+
+    if len(merged) > MAX_RANGES:
+        raise RangeNotSatisfiable
+    return merged
+
+
+def pick_chunk_size(from_bytes: int, until_bytes: int) -> int:
+    """
+    Picks the Telegram request size for a range. Small seeks and probes use the
+    smallest power of two that covers them, bulk downloads use the maximum limit.
+    """
+    length = until_bytes - from_bytes + 1
+    chunk_size = MIN_CHUNK_SIZE
+    while chunk_size < length and chunk_size < MAX_CHUNK_SIZE:
+        chunk_size *= 2
+    return chunk_size
+
+
+def plan_parts(from_bytes: int, until_bytes: int) -> Tuple[int, int, int, int, int]:
+    """
+    Returns the yield_file arguments for an inclusive byte range:
+    (offset, first_part_cut, last_part_cut, part_count, chunk_size).
+    """
+    chunk_size = pick_chunk_size(from_bytes, until_bytes)
+    offset = from_bytes - (from_bytes % chunk_size)
+    first_part_cut = from_bytes - offset
+    last_part_cut = until_bytes % chunk_size + 1
+    part_count = until_bytes // chunk_size - offset // chunk_size + 1
+    return offset, first_part_cut, last_part_cut, part_count, chunk_size
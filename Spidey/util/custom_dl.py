@@ -2,8 +2,10 @@ import math
 import asyncio
 import logging
 from info import *
-from typing import Dict, Union
+from collections import OrderedDict
+from typing import Dict, Optional, Union
 from Spidey.bot import work_loads
+from .traffic import traffic
 from pyrogram import Client, utils, raw
 from .file_properties import get_file_ids
 from pyrogram.session import Session, Auth
@@ -11,6 +13,36 @@ from pyrogram.errors import AuthBytesInvalid
 from Spidey.server.exceptions import FIleNotFound
 from pyrogram.file_id import FileId, FileType, ThumbnailSource
 
+# Leading bytes of recently streamed files, shared by every client so that
+# player probes can be answered without talking to Telegram.
+PROBE_SIZE = 64 * 1024
+MAX_CACHED_HEADS = 256
+cached_heads: "OrderedDict[int, bytes]" = OrderedDict()
+
+
+def get_cached_head(id: int, until_bytes: int) -> Optional[bytes]:
+    """
+    Returns the cached leading bytes of a file if they cover `until_bytes`.
+    """
+    head = cached_heads.get(id)
+    if head is None or until_bytes >= len(head):
+        return None
+    cached_heads.move_to_end(id)
+    return head
+
+
+def cache_head(id: int, chunk: bytes, file_size: int) -> None:
+    """
+    Keeps the first PROBE_SIZE bytes of a file, or the whole file when it is smaller.
+    """
+    head = chunk[:PROBE_SIZE]
+    if len(head) < min(PROBE_SIZE, file_size):
+        return
+    cached_heads[id] = head
+    cached_heads.move_to_end(id)
+    while len(cached_heads) > MAX_CACHED_HEADS:
+        cached_heads.popitem(last=False)
+
 
 class ByteStreamer:
     def __init__(self, client: Client):
@@ -169,39 +201,46 @@ class ByteStreamer:
         last_part_cut: int,
         part_count: int,
         chunk_size: int,
+        remote: str = None,
+        id: int = None,
     ) -> Union[str, None]:
         """
         Custom generator that yields the bytes of the media file.
+        Every yielded part is paid for through the traffic token buckets and
+        accounted to the client index, the remote IP and the message id.
         Modded from <https://github.com/eyaadh/megadlbot_oss/blob/master/mega/telegram/utils/custom_download.py#L20>
         Thanks to Eyaadh <https://github.com/eyaadh>
         """
         client = self.client
         work_loads[index] += 1
         logging.debug(f"Starting to yielding file with client {index}.")
-        media_session = await self.generate_media_session(client, file_id)
 
         current_part = 1
-        location = await self.get_location(file_id)
 
         try:
+            media_session = await self.generate_media_session(client, file_id)
+            location = await self.get_location(file_id)
             r = await media_session.send(
                 raw.functions.upload.GetFile(
                     location=location, offset=offset, limit=chunk_size
                 ),
             )
             if isinstance(r, raw.types.upload.File):
+                if offset == 0 and id is not None:
+                    cache_head(id, r.bytes, file_id.file_size)
                 while True:
                     chunk = r.bytes
                     if not chunk:
                         break
                     elif part_count == 1:
-                        yield chunk[first_part_cut:last_part_cut]
+                        chunk = chunk[first_part_cut:last_part_cut]
                     elif current_part == 1:
-                        yield chunk[first_part_cut:]
+                        chunk = chunk[first_part_cut:]
                     elif current_part == part_count:
-                        yield chunk[:last_part_cut]
-                    else:
-                        yield chunk
+                        chunk = chunk[:last_part_cut]
+
+                    await traffic.throttle(index, remote, id, len(chunk))
+                    yield chunk
 
                     current_part += 1
                     offset += chunk_size
@@ -217,7 +256,7 @@ class ByteStreamer:
         except (TimeoutError, AttributeError):
             pass
         finally:
-            logging.debug("Finished yielding file with {current_part} parts.")
+            logging.debug(f"Finished yielding file with {current_part} parts.")
             work_loads[index] -= 1
 
     
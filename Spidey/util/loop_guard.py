@@ -0,0 +1,51 @@
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+
+
+class LoopGuard:
+    def __init__(self, threshold: float):
+        """Debug aid that reports code blocking the event loop, like a sync MongoDB call.
+        attributes:
+            threshold: seconds the loop may go without running the heartbeat.
+            beat: time.monotonic() of the last heartbeat.
+
+        functions:
+            start: turns on asyncio debug mode and starts the heartbeat and the watchdog thread.
+        """
+        self.threshold = threshold
+        self.beat = time.monotonic()
+        self.loop = None
+        self.loop_thread = None
+
+    def start(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread = threading.get_ident()
+        # asyncio itself then logs every callback slower than the threshold
+        self.loop.set_debug(True)
+        self.loop.slow_callback_duration = self.threshold
+        self.loop.create_task(self.heartbeat())
+        threading.Thread(target=self.watchdog, name="loop-guard", daemon=True).start()
+        logging.warning(f"Loop guard on, reporting event loop stalls over {self.threshold}s")
+
+    async def heartbeat(self) -> None:
+        while True:
+            self.beat = time.monotonic()
+            await asyncio.sleep(self.threshold / 2)
+
+    def watchdog(self) -> None:
+        reported = None
+        while not self.loop.is_closed():
+            time.sleep(self.threshold / 4)
+            beat = self.beat
+            stalled = time.monotonic() - beat
+            if stalled < self.threshold or reported == beat:
+                continue
+            # Report each stall once, with what the loop thread is stuck on
+            reported = beat
+            frame = sys._current_frames().get(self.loop_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame else "unavailable"
+            logging.warning(f"Event loop blocked for {stalled:.2f}s, loop thread stack:\n{stack}")
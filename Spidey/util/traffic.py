@@ -0,0 +1,169 @@
+import time
+import asyncio
+from collections import deque
+from typing import Dict, Optional
+from info import (
+    STREAM_RATE_GLOBAL, STREAM_RATE_PER_IP,
+    STREAM_MAX_CONNECTIONS, STREAM_MAX_CONNECTIONS_PER_IP,
+)
+
+
+class TokenBucket:
+    def __init__(self, rate: int, burst: Optional[int] = None):
+        """A byte token bucket.
+        attributes:
+            rate: refill rate in bytes per second, 0 disables the limit.
+            burst: bucket capacity in bytes, defaults to one second of traffic.
+        """
+        self.rate = rate
+        self.burst = burst or rate
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def consume(self, amount: int) -> None:
+        """
+        Takes `amount` tokens from the bucket, sleeping until the bucket can pay for them.
+        Amounts larger than the burst are allowed and simply put the bucket in debt.
+        """
+        if not self.rate:
+            return
+        self._refill()
+        self.tokens -= amount
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+class RateCounter:
+    __slots__ = ("total", "window", "slots")
+
+    def __init__(self, window: int = 10):
+        """Counts bytes in total and over a sliding window of one second slots."""
+        self.total = 0
+        self.window = window
+        self.slots = deque()
+
+    def add(self, amount: int) -> None:
+        now = int(time.monotonic())
+        self.total += amount
+        if self.slots and self.slots[-1][0] == now:
+            self.slots[-1][1] += amount
+        else:
+            self.slots.append([now, amount])
+        self._trim(now)
+
+    def _trim(self, now: int) -> None:
+        while self.slots and self.slots[0][0] <= now - self.window:
+            self.slots.popleft()
+
+    def rate(self) -> float:
+        """Returns the average bytes per second over the window."""
+        self._trim(int(time.monotonic()))
+        return sum(amount for _, amount in self.slots) / self.window
+
+
+class TrafficMonitor:
+    def __init__(self):
+        """Accounts streamed bytes and enforces the bandwidth and concurrency caps.
+        attributes:
+            clients: a dict of byte counters per client index.
+            remotes: a dict of byte counters per remote IP.
+            files: a dict of byte counters per message id.
+            active: a dict of open streams per remote IP.
+
+        functions:
+            try_open: takes a stream slot for a remote IP if the caps allow it.
+            closed: gives a slot taken by try_open back.
+            throttle: waits for the global and per-IP buckets, then accounts the bytes.
+            snapshot: returns the live throughput as a plain dict.
+        """
+        self.total = RateCounter()
+        self.clients: Dict[int, RateCounter] = {}
+        self.remotes: Dict[str, RateCounter] = {}
+        self.files: Dict[int, RateCounter] = {}
+        self.active: Dict[str, int] = {}
+        self.global_bucket = TokenBucket(STREAM_RATE_GLOBAL)
+        self.remote_buckets: Dict[str, TokenBucket] = {}
+
+    def try_open(self, remote: str) -> bool:
+        # Checked and counted in one step, parallel requests can't all pass before any is counted
+        if STREAM_MAX_CONNECTIONS and sum(self.active.values()) >= STREAM_MAX_CONNECTIONS:
+            return False
+        if STREAM_MAX_CONNECTIONS_PER_IP and self.active.get(remote, 0) >= STREAM_MAX_CONNECTIONS_PER_IP:
+            return False
+        self.active[remote] = self.active.get(remote, 0) + 1
+        return True
+
+    def closed(self, remote: str) -> None:
+        count = self.active.get(remote, 0) - 1
+        if count > 0:
+            self.active[remote] = count
+            return
+        self.active.pop(remote, None)
+        # Idle remotes keep nothing but their byte counter
+        self.remote_buckets.pop(remote, None)
+        self.clean()
+
+    async def throttle(self, index: int, remote: str, id: int, amount: int) -> None:
+        await self.global_bucket.consume(amount)
+        if STREAM_RATE_PER_IP:
+            bucket = self.remote_buckets.get(remote)
+            if bucket is None:
+                bucket = self.remote_buckets[remote] = TokenBucket(STREAM_RATE_PER_IP)
+            await bucket.consume(amount)
+        self.total.add(amount)
+        for table, key in ((self.clients, index), (self.remotes, remote), (self.files, id)):
+            counter = table.get(key)
+            if counter is None:
+                counter = table[key] = RateCounter()
+            counter.add(amount)
+
+    def clean(self) -> None:
+        """Drops counters that had no traffic during the last window."""
+        for table in (self.files, self.remotes):
+            for key in [key for key, counter in table.items() if not counter.rate()]:
+                if key not in self.active:
+                    del table[key]
+
+    def snapshot(self, detail: bool = True) -> dict:
+        """detail adds the per IP and per file counters, which are not for the public."""
+        self.clean()
+        stats = {
+            "total_bytes": self.total.total,
+            "bytes_per_second": self.total.rate(),
+            "active_streams": sum(self.active.values()),
+            "clients": {
+                str(index): {"bytes": counter.total, "bytes_per_second": counter.rate()}
+                for index, counter in self.clients.items()
+            },
+            "limits": {
+                "rate_global": STREAM_RATE_GLOBAL,
+                "rate_per_ip": STREAM_RATE_PER_IP,
+                "max_connections": STREAM_MAX_CONNECTIONS,
+                "max_connections_per_ip": STREAM_MAX_CONNECTIONS_PER_IP,
+            },
+        }
+        if not detail:
+            return stats
+        stats.update({
+            "remotes": {
+                remote: {
+                    "bytes": counter.total,
+                    "bytes_per_second": counter.rate(),
+                    "streams": self.active.get(remote, 0),
+                }
+                for remote, counter in self.remotes.items()
+            },
+            "files": {
+                str(id): {"bytes": counter.total, "bytes_per_second": counter.rate()}
+                for id, counter in self.files.items()
+            },
+        })
+        return stats
+
+
+traffic = TrafficMonitor()
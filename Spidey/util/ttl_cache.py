@@ -0,0 +1,122 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Every TTLCache by name, for the /stats route
+caches: Dict[str, "TTLCache"] = {}
+
+
+def approx_size(value: Any, depth: int = 2) -> int:
+    """Rough memory footprint, following tuples, lists and dicts `depth` levels down."""
+    size = sys.getsizeof(value)
+    if depth and isinstance(value, (tuple, list, set, frozenset)):
+        size += sum(approx_size(item, depth - 1) for item in value)
+    elif depth and isinstance(value, dict):
+        size += sum(approx_size(k, 0) + approx_size(v, depth - 1) for k, v in value.items())
+    return size
+
+
+class TTLCache:
+    def __init__(self, name: str, maxsize: int, ttl: float, max_bytes: int = 0,
+                 sizeof: Optional[Callable[[Any], int]] = None):
+        """A dict-like LRU store with a size cap, a memory cap and per entry expiry.
+        attributes:
+            maxsize: the number of entries kept, the least recently used go first.
+            ttl: seconds an entry lives after it was set.
+            max_bytes: approximate memory cap for the stored values, 0 disables it.
+            bytes: the approximate memory held right now.
+            hits / misses / expired / evicted: counters exposed by `stats`.
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or approx_size
+        self.data: "OrderedDict[Hashable, list]" = OrderedDict()
+        # The same keys in the order they were set, reads reorder `data` but not this
+        self.order: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.expired = self.evicted = 0
+        caches[name] = self
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._drop(key)
+        size = self.sizeof(value)
+        self.data[key] = [time.monotonic() + self.ttl, size, value]
+        self.order[key] = self.data[key][0]
+        self.bytes += size
+        self._purge()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        entry = self.data.get(key)
+        if entry is None:
+            self.misses += 1
+            raise KeyError(key)
+        if entry[0] <= time.monotonic():
+            self._drop(key)
+            self.expired += 1
+            self.misses += 1
+            raise KeyError(key)
+        self.data.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self.data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._drop(key)
+        return entry[2] if entry else default
+
+    def values(self):
+        now = time.monotonic()
+        return [entry[2] for entry in self.data.values() if entry[0] > now]
+
+    def clear(self) -> None:
+        self.data.clear()
+        self.order.clear()
+        self.bytes = 0
+
+    def _drop(self, key: Hashable) -> Optional[list]:
+        entry = self.data.pop(key, None)
+        self.order.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+        return entry
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        # Every entry lives `ttl`, so the first set expires first, stop at the first one still alive
+        while self.order:
+            key, expires = next(iter(self.order.items()))
+            if expires > now:
+                break
+            self._drop(key)
+            self.expired += 1
+        while self.data and (len(self.data) > self.maxsize or (self.max_bytes and self.bytes > self.max_bytes)):
+            self._drop(next(iter(self.data)))
+            self.evicted += 1
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.data),
+            "bytes": self.bytes,
+            "maxsize": self.maxsize,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
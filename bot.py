@@ -1,7 +1,3 @@
-import sys
-import glob
-import importlib
-from pathlib import Path
 import asyncio
 import logging
 import logging.config
@@ -14,6 +10,10 @@ from pyrogram.raw.all import layer
 
 from database.ia_filterdb import Media
 from database.users_chats_db import db
+from database.config_db import mdb
+from database.verify_db import vr_db
+from database.delete_scheduler import delete_scheduler
+from database.premium_scheduler import premium_expiry
 from info import *
 from utils import temp
 from typing import Union, Optional, AsyncGenerator
@@ -26,6 +26,9 @@ import pyrogram
 from Spidey.bot import SpideyBot
 from Spidey.util.keepalive import ping_server
 from Spidey.bot.clients import initialize_clients
+from Spidey.bot.plugin_loader import plugins
+from Spidey.bot.broadcast import broadcast_jobs
+from Spidey.util.loop_guard import LoopGuard
 
 
 # =========================
@@ -40,9 +43,6 @@ logging.getLogger("aiohttp.web").setLevel(logging.ERROR)
 # =========================
 # GLOBAL VARIABLES
 # =========================
-PLUGIN_PATH = "plugins/*.py"
-files = glob.glob(PLUGIN_PATH)
-
 pyrogram.utils.MIN_CHANNEL_ID = -1002294764885  # Optional ID setup
 
 loop = asyncio.get_event_loop()
@@ -54,6 +54,14 @@ loop = asyncio.get_event_loop()
 async def Spidey_start():
     print("\n🕷️ Initializing Spidey Filter Bot...\n")
 
+    # ✅ Report blocking calls on the event loop (debug only)
+    if LOOP_GUARD:
+        LoopGuard(LOOP_GUARD_THRESHOLD).start()
+
+    # ✅ Import plugins once, rarely used extras on their first command
+    plugins.load(SpideyBot, lazy=LAZY_PLUGINS)
+    plugins.report()
+
     # ✅ Start the bot (Fixed)
     await SpideyBot.start()
 
@@ -64,29 +72,29 @@ async def Spidey_start():
     # ✅ Initialize extra clients
     await initialize_clients()
 
-    # ✅ Load all plugins dynamically
-    for file in files:
-        with open(file) as f:
-            path = Path(f.name)
-            plugin_name = path.stem
-            import_path = f"plugins.{plugin_name}"
-            spec = importlib.util.spec_from_file_location(import_path, path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            sys.modules[import_path] = module
-            print(f"✅ Spidey Imported => {plugin_name}")
-
     # ✅ Keep server alive (for Heroku)
     if ON_HEROKU:
         asyncio.create_task(ping_server())
 
-    # ✅ Load banned users & chats
-    b_users, b_chats = await db.get_banned()
-    temp.BANNED_USERS = b_users
-    temp.BANNED_CHATS = b_chats
+    # ✅ Load banned users & chats, db keeps the sets current from here on
+    await db.get_banned()
 
     # ✅ Ensure indexes
     await Media.ensure_indexes()
+    await db.imdb_cache.create_index("expire_at", expireAfterSeconds=0)
+    await vr_db.start()
+
+    # ✅ Write buffered search counts in the background
+    mdb.start_search_stats()
+
+    # ✅ Resume pending auto deletes
+    await delete_scheduler.start(SpideyBot)
+
+    # ✅ Expire premium users on time
+    await premium_expiry.start(SpideyBot)
+
+    # ✅ Resume broadcasts a restart interrupted
+    await broadcast_jobs.start(SpideyBot)
 
     # ✅ Store bot details
     me = await SpideyBot.get_me()
@@ -120,6 +128,7 @@ async def Spidey_start():
 
     # ✅ Idle (bot runs continuously)
     await idle()
+    await mdb.flush_top_messages()
 
     for admin in ADMINS:
         try:
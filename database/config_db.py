@@ -1,7 +1,11 @@
+import asyncio
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
-from info import DATABASE_URI
+from pymongo import ReplaceOne
+from info import DATABASE_URI, SEARCH_STATS_FLUSH_TIME
 from datetime import datetime
 from database.multi_db_manager import get_file_storage_1_database
+from database.top_searches import TopSearches, TOP_SEARCH_COUNTERS
 
 class Database:
     def __init__(self, uri, db_name):
@@ -16,34 +20,71 @@ class Database:
             self.db = self.client[db_name]
         
         self.col = self.db.user
+        self.sketch_col = self.db.search_sketches
         self.config_col = self.db.configuration
+        self.top_searches = TopSearches()
+        # Held so the task isn't garbage collected while it sleeps
+        self.flusher = None
 
     async def update_top_messages(self, user_id, message_text):
-        user = await self.col.find_one({"user_id": user_id, "messages.text": message_text})
-        
-        if not user:
-            await self.col.update_one(
-                {"user_id": user_id},
-                {"$push": {"messages": {"text": message_text, "count": 1}}},
-                upsert=True
-            )
-        else:
-            await self.col.update_one(
-                {"user_id": user_id, "messages.text": message_text},
-                {"$inc": {"messages.$.count": 1}}
-            )
+        # Counted in memory, flush_top_messages persists the sketches
+        self.top_searches.add(message_text)
+
+    async def flush_top_messages(self):
+        documents = self.top_searches.dump()
+        if not documents:
+            return
+        requests = [ReplaceOne({"_id": document["_id"]}, document, upsert=True) for document in documents]
+        try:
+            await self.sketch_col.bulk_write(requests, ordered=False)
+            await self.sketch_col.delete_many({"_id": {"$regex": "^day:", "$lt": self.top_searches.oldest_id()}})
+        except Exception as e:
+            logging.error(f"Failed to persist search sketches: {e}")
+            # Write them again with the next flush
+            self.top_searches.dirty.update(document["_id"] for document in documents)
 
-    async def get_top_messages(self, limit=30):
-        pipeline = [
+    def start_search_stats(self):
+        self.flusher = asyncio.create_task(self.search_stats_flusher())
+
+    async def search_stats_flusher(self):
+        try:
+            self.top_searches.load([document async for document in self.sketch_col.find({})])
+            await self.migrate_top_messages()
+        except Exception:
+            logging.exception("Failed to load the search sketches")
+        while True:
+            await asyncio.sleep(SEARCH_STATS_FLUSH_TIME)
+            try:
+                await self.flush_top_messages()
+            except Exception:
+                logging.exception("Failed to flush the search sketches")
+
+    async def migrate_top_messages(self):
+        """Folds the old per-user `messages` arrays into the all time sketch once."""
+        legacy = self.col.aggregate([
+            {"$match": {"messages": {"$exists": True}}},
             {"$unwind": "$messages"},
             {"$group": {"_id": "$messages.text", "count": {"$sum": "$messages.count"}}},
             {"$sort": {"count": -1}},
-            {"$limit": limit}
-        ]
-        results = await self.col.aggregate(pipeline).to_list(limit)
-        return [result['_id'] for result in results]
+            {"$limit": TOP_SEARCH_COUNTERS},
+        ])
+        migrated = False
+        async for result in legacy:
+            if result["_id"] is not None:
+                self.top_searches.all_time.add(result["_id"], result["count"])
+                migrated = True
+        if migrated:
+            self.top_searches.dirty.add("all")
+            await self.flush_top_messages()
+            await self.col.update_many({}, {"$unset": {"messages": ""}})
+
+    async def get_top_messages(self, limit=30, window=None):
+        """window is None for all time, "today" or "week"."""
+        return self.top_searches.top(limit, window)
     
     async def delete_all_messages(self):
+        self.top_searches = TopSearches()
+        await self.sketch_col.delete_many({})
         await self.col.delete_many({})
 
     def create_configuration_data(
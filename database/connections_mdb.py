@@ -1,17 +1,17 @@
-import pymongo
+from motor.motor_asyncio import AsyncIOMotorClient
 from info import DATABASE_URI, DATABASE_NAME
 
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
-myclient = pymongo.MongoClient(DATABASE_URI)
+myclient = AsyncIOMotorClient(DATABASE_URI)
 mydb = myclient[DATABASE_NAME]
 mycol = mydb['CONNECTION'] 
 
 
 async def add_connection(group_id, user_id):
-    query = mycol.find_one(
+    query = await mycol.find_one(
         { "_id": user_id },
         { "_id": 0, "active_group": 0 }
     )
@@ -30,16 +30,16 @@ async def add_connection(group_id, user_id):
         'active_group' : group_id,
     }
 
-    if mycol.count_documents( {"_id": user_id} ) == 0:
+    if await mycol.count_documents( {"_id": user_id} ) == 0:
         try:
-            mycol.insert_one(data)
+            await mycol.insert_one(data)
             return True
         except:
             logger.exception('Some error occurred!', exc_info=True)
 
     else:
         try:
-            mycol.update_one(
+            await mycol.update_one(
                 {'_id': user_id},
                 {
                     "$push": {"group_details": group_details},
@@ -53,7 +53,7 @@ async def add_connection(group_id, user_id):
         
 async def active_connection(user_id):
 
-    query = mycol.find_one(
+    query = await mycol.find_one(
         { "_id": user_id },
         { "_id": 0, "group_details": 0 }
     )
@@ -65,7 +65,7 @@ async def active_connection(user_id):
 
 
 async def all_connections(user_id):
-    query = mycol.find_one(
+    query = await mycol.find_one(
         { "_id": user_id },
         { "_id": 0, "active_group": 0 }
     )
@@ -76,7 +76,7 @@ async def all_connections(user_id):
 
 
 async def if_active(user_id, group_id):
-    query = mycol.find_one(
+    query = await mycol.find_one(
         { "_id": user_id },
         { "_id": 0, "group_details": 0 }
     )
@@ -84,7 +84,7 @@ async def if_active(user_id, group_id):
 
 
 async def make_active(user_id, group_id):
-    update = mycol.update_one(
+    update = await mycol.update_one(
         {'_id': user_id},
         {"$set": {"active_group" : group_id}}
     )
@@ -92,7 +92,7 @@ async def make_active(user_id, group_id):
 
 
 async def make_inactive(user_id):
-    update = mycol.update_one(
+    update = await mycol.update_one(
         {'_id': user_id},
         {"$set": {"active_group" : None}}
     )
@@ -102,13 +102,13 @@ async def make_inactive(user_id):
 async def delete_connection(user_id, group_id):
 
     try:
-        update = mycol.update_one(
+        update = await mycol.update_one(
             {"_id": user_id},
             {"$pull" : { "group_details" : {"group_id":group_id} } }
         )
         if update.modified_count == 0:
             return False
-        query = mycol.find_one(
+        query = await mycol.find_one(
             { "_id": user_id },
             { "_id": 0 }
         )
@@ -116,12 +116,12 @@ async def delete_connection(user_id, group_id):
             if query['active_group'] == group_id:
                 prvs_group_id = query["group_details"][len(query["group_details"]) - 1]["group_id"]
 
-                mycol.update_one(
+                await mycol.update_one(
                     {'_id': user_id},
                     {"$set": {"active_group" : prvs_group_id}}
                 )
         else:
-            mycol.update_one(
+            await mycol.update_one(
                 {'_id': user_id},
                 {"$set": {"active_group" : None}}
             )
@@ -0,0 +1,113 @@
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+from pyrogram.errors import FloodWait
+from database.users_chats_db import db
+
+logger = logging.getLogger(__name__)
+
+# delete_messages takes at most 100 ids per call
+DELETE_BATCH = 100
+
+
+class DeleteScheduler:
+    def __init__(self):
+        """Deletes messages later from one timer loop instead of sleeping handlers.
+        attributes:
+            heap: a min heap of (run_at, seq, job), run_at is a unix timestamp so
+                jobs stored in MongoDB stay valid across restarts.
+            wakeup: set when a job earlier than the current head is added.
+
+        functions:
+            start: loads the pending jobs and starts the timer loop.
+            schedule: deletes `message_ids` in `chat_id` after `delay` seconds, then
+                optionally edits one message to `edit_text`.
+        """
+        self.heap = []
+        self.seq = itertools.count()
+        self.wakeup = None
+        self.client = None
+
+    async def start(self, client):
+        self.client = client
+        self.wakeup = asyncio.Event()
+        async for job in db.pending_deletes.find({}):
+            heapq.heappush(self.heap, (job['run_at'], next(self.seq), job))
+        if self.heap:
+            logger.info(f"Restored {len(self.heap)} pending auto deletes")
+        asyncio.create_task(self.run())
+
+    async def schedule(self, chat_id, message_ids, delay, edit_id=None, edit_text=None):
+        job = {
+            'chat_id': chat_id,
+            'message_ids': [id for id in message_ids if id],
+            'run_at': time.time() + delay,
+        }
+        if edit_id:
+            job['edit'] = {'message_id': edit_id, 'text': edit_text}
+        try:
+            await db.pending_deletes.insert_one(job)
+        except Exception as e:
+            # Still delete on time, it just won't survive a restart
+            logger.error(f"Failed to store auto delete for {chat_id}: {e}")
+        if not self.heap or job['run_at'] < self.heap[0][0]:
+            if self.wakeup:
+                self.wakeup.set()
+        heapq.heappush(self.heap, (job['run_at'], next(self.seq), job))
+
+    async def run(self):
+        while True:
+            timeout = self.heap[0][0] - time.time() if self.heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self.wakeup.clear()
+            due = []
+            now = time.time()
+            while self.heap and self.heap[0][0] <= now:
+                due.append(heapq.heappop(self.heap)[2])
+            if due:
+                try:
+                    await self.execute(due)
+                except Exception as e:
+                    logger.exception(f"Auto delete batch failed: {e}")
+
+    async def execute(self, jobs):
+        chats = {}
+        for job in jobs:
+            chats.setdefault(job['chat_id'], []).extend(job['message_ids'])
+        for chat_id, message_ids in chats.items():
+            for i in range(0, len(message_ids), DELETE_BATCH):
+                await self.delete(chat_id, message_ids[i:i + DELETE_BATCH])
+        for job in jobs:
+            edit = job.get('edit')
+            if edit:
+                try:
+                    await self.client.edit_message_text(job['chat_id'], edit['message_id'], edit['text'])
+                except Exception:
+                    pass
+        ids = [job['_id'] for job in jobs if '_id' in job]
+        if ids:
+            await db.pending_deletes.delete_many({'_id': {'$in': ids}})
+
+    async def delete(self, chat_id, message_ids):
+        try:
+            await self.client.delete_messages(chat_id, message_ids)
+        except FloodWait as e:
+            await asyncio.sleep(e.value)
+            await self.delete(chat_id, message_ids)
+        except Exception:
+            # One message we can't delete fails the whole call, retry them one by one
+            if len(message_ids) > 1:
+                for message_id in message_ids:
+                    try:
+                        await self.client.delete_messages(chat_id, message_id)
+                    except Exception:
+                        pass
+
+
+delete_scheduler = DeleteScheduler()
@@ -27,6 +27,22 @@ class Media(Document):
         indexes = ('$file_name', )
         collection_name = COLLECTION_NAME
 
+# Read path: raw projections into MediaRecord, umongo is only used for writes
+RESULT_FIELDS = {'file_name': 1, 'file_size': 1, 'caption': 1}
+
+class MediaRecord:
+    """A search hit with just the fields result pages and delivery read."""
+    __slots__ = ('file_id', 'file_name', 'file_size', 'caption')
+
+    def __init__(self, doc):
+        self.file_id = doc['_id']
+        self.file_name = doc.get('file_name', '')
+        self.file_size = doc.get('file_size', 0)
+        self.caption = doc.get('caption')
+
+    def __repr__(self):
+        return f"MediaRecord({self.file_id!r}, {self.file_name!r})"
+
 async def get_files_db_size():
     return (await mydb.command("dbstats"))['dataSize']
     
@@ -72,10 +88,10 @@ async def get_search_results(query, max_results=MAX_BTN, offset=0, lang=None):
     except:
         regex = query
     filter = {'file_name': regex}
-    cursor = Media.find(filter)
+    cursor = Media.collection.find(filter, RESULT_FIELDS)
     cursor.sort('$natural', -1)
     if lang:
-        lang_files = [file async for file in cursor if lang in file.file_name.lower()]
+        lang_files = [MediaRecord(doc) async for doc in cursor if lang in doc['file_name'].lower()]
         files = lang_files[offset:][:max_results]
         total_results = len(lang_files)
         next_offset = offset + max_results
@@ -83,8 +99,8 @@ async def get_search_results(query, max_results=MAX_BTN, offset=0, lang=None):
             next_offset = ''
         return files, next_offset, total_results
     cursor.skip(offset).limit(max_results)
-    files = await cursor.to_list(length=max_results)
-    total_results = await Media.count_documents(filter)
+    files = [MediaRecord(doc) async for doc in cursor]
+    total_results = await Media.collection.count_documents(filter)
     next_offset = offset + max_results
     if next_offset >= total_results:
         next_offset = ''       
@@ -112,10 +128,8 @@ async def get_bad_files(query, file_type=None, offset=0, filter=False):
     return files, total_results
     
 async def get_file_details(query):
-    filter = {'file_id': query}
-    cursor = Media.find(filter)
-    filedetails = await cursor.to_list(length=1)
-    return filedetails
+    doc = await Media.collection.find_one({'_id': query}, RESULT_FIELDS)
+    return [MediaRecord(doc)] if doc else []
 
 def encode_file_id(s: bytes) -> str:
     r = b""
@@ -0,0 +1,127 @@
+import heapq
+import asyncio
+import logging
+from datetime import datetime, timezone
+from database.users_chats_db import db
+from info import LOG_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Expiry times held in memory, later ones are loaded once these ran out
+EXPIRY_WINDOW = 1000
+
+
+def utc_time(expiry_time):
+    """expiry_time is stored and compared as naive UTC, the way MongoDB returns it.
+    Redeem hands over aware datetimes, those are converted, naive ones already are UTC."""
+    if expiry_time is not None and expiry_time.tzinfo is not None:
+        return expiry_time.astimezone(timezone.utc).replace(tzinfo=None)
+    return expiry_time
+
+
+class PremiumExpiry:
+    def __init__(self):
+        """Removes premium when it runs out, sleeping until the next expiry instead of polling.
+        Every time here is naive UTC, compared against datetime.utcnow(), whatever the host's TZ.
+        attributes:
+            heap: a min heap of (expiry_time, user_id) for the soonest EXPIRY_WINDOW expiries.
+            scheduled: user_id -> the expiry_time its live heap entry has, extended or
+                removed premium leaves a stale entry behind that gets skipped.
+            horizon: the last expiry loaded when the window was full, later ones wait for
+                the next load, None when every expiry fit.
+            wakeup: set when an expiry earlier than the current head is added.
+
+        functions:
+            start: makes sure expiry_time is indexed, loads the window and starts the timer loop.
+            schedule: db.premium_changed hook, called whenever premium is granted, extended or removed.
+        """
+        self.heap = []
+        self.scheduled = {}
+        self.horizon = None
+        self.wakeup = None
+        self.client = None
+
+    async def start(self, client):
+        self.client = client
+        self.wakeup = asyncio.Event()
+        await db.users.create_index("expiry_time")
+        await self.load()
+        db.premium_watchers.append(self.schedule)
+        asyncio.create_task(self.run())
+
+    async def load(self):
+        self.heap = []
+        self.scheduled = {}
+        cursor = db.users.find({'expiry_time': {'$ne': None}}, {'id': 1, 'expiry_time': 1})
+        async for user in cursor.sort('expiry_time', 1).limit(EXPIRY_WINDOW):
+            self.scheduled[user['id']] = utc_time(user['expiry_time'])
+            self.heap.append((self.scheduled[user['id']], user['id']))
+        heapq.heapify(self.heap)
+        self.horizon = max(self.heap)[0] if len(self.heap) >= EXPIRY_WINDOW else None
+
+    def schedule(self, user_id, expiry_time):
+        expiry_time = utc_time(expiry_time)
+        if expiry_time is None or (self.horizon and expiry_time > self.horizon):
+            self.scheduled.pop(user_id, None)
+            return
+        self.scheduled[user_id] = expiry_time
+        if not self.heap or expiry_time < self.heap[0][0]:
+            if self.wakeup:
+                self.wakeup.set()
+        heapq.heappush(self.heap, (expiry_time, user_id))
+
+    async def run(self):
+        while True:
+            if not self.heap and self.horizon:
+                try:
+                    await self.load()
+                except Exception as e:
+                    logger.exception(f"Failed to load premium expiries: {e}")
+                    await asyncio.sleep(60)
+                    continue
+            timeout = (self.heap[0][0] - datetime.utcnow()).total_seconds() if self.heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self.wakeup.clear()
+            due = []
+            now = datetime.utcnow()
+            while self.heap and self.heap[0][0] <= now:
+                expiry_time, user_id = heapq.heappop(self.heap)
+                if self.scheduled.get(user_id) == expiry_time:
+                    del self.scheduled[user_id]
+                    due.append(user_id)
+            if due:
+                try:
+                    await self.expire(due, now)
+                except Exception as e:
+                    logger.exception(f"Premium expiry batch failed: {e}")
+
+    async def expire(self, user_ids, now):
+        # Premium may have been extended behind our back, only expire what MongoDB agrees on
+        query = {'id': {'$in': user_ids}, 'expiry_time': {'$ne': None, '$lte': now}}
+        expired = [user['id'] async for user in db.users.find(query, {'id': 1})]
+        if not expired:
+            return
+        await db.users.update_many({'id': {'$in': expired}}, {'$set': {'expiry_time': None}})
+        for user_id in expired:
+            db.premium_changed(user_id, None)
+        for user_id in expired:
+            await self.notify(user_id)
+            await asyncio.sleep(0.5)
+
+    async def notify(self, user_id):
+        try:
+            user = await self.client.get_users(user_id)
+            await self.client.send_message(
+                chat_id=user_id,
+                text=f"<b>ʜᴇʏ {user.mention},\n\nʏᴏᴜʀ ᴘʀᴇᴍɪᴜᴍ ᴀᴄᴄᴇss ʜᴀs ᴇxᴘɪʀᴇᴅ, ᴛʜᴀɴᴋ ʏᴏᴜ ꜰᴏʀ ᴜsɪɴɢ ᴏᴜʀ sᴇʀᴠɪᴄᴇ 😊\n\nɪꜰ ʏᴏᴜ ᴡᴀɴᴛ ᴛᴏ ᴛᴀᴋᴇ ᴛʜᴇ ᴘʀᴇᴍɪᴜᴍ ᴀɢᴀɪɴ, ᴛʜᴇɴ ᴄʟɪᴄᴋ ᴏɴ ᴛʜᴇ /plan ꜰᴏʀ ᴛʜᴇ ᴅᴇᴛᴀɪʟs ᴏꜰ ᴛʜᴇ ᴘʟᴀɴs...</b>"
+            )
+            await self.client.send_message(LOG_CHANNEL, text=f"<b>#Premium_Expire\n\nUser name: {user.mention}\nUser id: <code>{user_id}</code>")
+        except Exception as e:
+            logger.error(f"Failed to notify {user_id} about expired premium: {e}")
+
+
+premium_expiry = PremiumExpiry()
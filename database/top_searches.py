@@ -0,0 +1,142 @@
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Counters kept per sketch, queries below the k-th heaviest get evicted
+TOP_SEARCH_COUNTERS = 1000
+# Daily sketches kept for the "week" window
+TOP_SEARCH_DAYS = 7
+
+
+class SpaceSaving:
+    __slots__ = ("capacity", "counters", "heap")
+
+    def __init__(self, capacity: int = TOP_SEARCH_COUNTERS):
+        """Space-Saving heavy hitter sketch.
+        attributes:
+            capacity: the number of queries tracked at once.
+            counters: a dict of query -> [count, error], count over-estimates the
+                real count by at most error.
+            heap: a lazy min heap of (count, query), entries that no longer match
+                `counters` are skipped when popping.
+        """
+        self.capacity = capacity
+        self.counters: Dict[str, List[int]] = {}
+        self.heap: List[Tuple[int, str]] = []
+
+    def add(self, text: str, amount: int = 1) -> None:
+        counter = self.counters.get(text)
+        if counter is None:
+            if len(self.counters) < self.capacity:
+                counter = self.counters[text] = [0, 0]
+            else:
+                # Replace the lightest query and inherit its count as error
+                floor = self._pop_min()
+                counter = self.counters[text] = [floor, floor]
+        counter[0] += amount
+        heapq.heappush(self.heap, (counter[0], text))
+        if len(self.heap) > 4 * self.capacity:
+            self._rebuild()
+
+    def _pop_min(self) -> int:
+        while True:
+            count, text = heapq.heappop(self.heap)
+            counter = self.counters.get(text)
+            if counter is not None and counter[0] == count:
+                del self.counters[text]
+                return count
+
+    def _rebuild(self) -> None:
+        self.heap = [(counter[0], text) for text, counter in self.counters.items()]
+        heapq.heapify(self.heap)
+
+    def top(self, limit: int) -> List[Tuple[str, int]]:
+        return heapq.nlargest(limit, ((text, counter[0]) for text, counter in self.counters.items()), key=lambda item: item[1])
+
+    def dump(self) -> List[list]:
+        # A list rather than a dict, queries may hold '.' or '$' which MongoDB refuses in keys
+        return [[text, count, error] for text, (count, error) in self.counters.items()]
+
+    @classmethod
+    def load(cls, counters: Iterable[list], capacity: int = TOP_SEARCH_COUNTERS) -> "SpaceSaving":
+        sketch = cls(capacity)
+        for text, count, error in sorted(counters, key=lambda item: item[1], reverse=True)[:capacity]:
+            sketch.counters[text] = [count, error]
+        sketch._rebuild()
+        return sketch
+
+
+class TopSearches:
+    def __init__(self):
+        """Keeps the most searched queries for all time and per day in memory.
+        attributes:
+            all_time: the Space-Saving sketch over every search.
+            days: a dict of "YYYY-MM-DD" -> sketch of that day's searches.
+            dirty: ids of the sketches changed since the last `dump`.
+
+        functions:
+            add: counts one search.
+            top: returns the heaviest queries for "all", "today" or "week".
+            dump / load: convert the sketches to and from MongoDB documents.
+        """
+        self.all_time = SpaceSaving()
+        self.days: Dict[str, SpaceSaving] = {}
+        self.dirty = set()
+
+    @staticmethod
+    def _day(offset: int = 0) -> str:
+        return (datetime.utcnow() - timedelta(days=offset)).strftime("%Y-%m-%d")
+
+    def add(self, text: str, amount: int = 1) -> None:
+        today = self._day()
+        sketch = self.days.get(today)
+        if sketch is None:
+            sketch = self.days[today] = SpaceSaving()
+            self._expire()
+        sketch.add(text, amount)
+        self.all_time.add(text, amount)
+        self.dirty.update(("all", f"day:{today}"))
+
+    def _expire(self) -> None:
+        keep = {self._day(offset) for offset in range(TOP_SEARCH_DAYS)}
+        for day in [day for day in self.days if day not in keep]:
+            del self.days[day]
+
+    def oldest_id(self) -> str:
+        """Id of the oldest day sketch still in the "week" window, older documents can go."""
+        return f"day:{self._day(TOP_SEARCH_DAYS - 1)}"
+
+    def top(self, limit: int, window: Optional[str] = None) -> List[str]:
+        if window == "today":
+            sketch = self.days.get(self._day())
+            return [text for text, _ in sketch.top(limit)] if sketch else []
+        if window == "week":
+            totals: Dict[str, int] = {}
+            for offset in range(TOP_SEARCH_DAYS):
+                sketch = self.days.get(self._day(offset))
+                if sketch is None:
+                    continue
+                for text, (count, _) in sketch.counters.items():
+                    totals[text] = totals.get(text, 0) + count
+            return heapq.nlargest(limit, totals, key=totals.get)
+        return [text for text, _ in self.all_time.top(limit)]
+
+    def dump(self) -> List[dict]:
+        """Returns the documents of the sketches changed since the last dump."""
+        documents = []
+        for id in self.dirty:
+            if id == "all":
+                documents.append({"_id": id, "counters": self.all_time.dump()})
+            elif id[4:] in self.days:
+                documents.append({"_id": id, "counters": self.days[id[4:]].dump()})
+        self.dirty = set()
+        return documents
+
+    def load(self, documents: Iterable[dict]) -> None:
+        for document in documents:
+            sketch = SpaceSaving.load(document.get("counters", []))
+            if document["_id"] == "all":
+                self.all_time = sketch
+            elif document["_id"].startswith("day:"):
+                self.days[document["_id"][4:]] = sketch
+        self._expire()
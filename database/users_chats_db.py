@@ -1,7 +1,8 @@
 import datetime
 import pytz
 from motor.motor_asyncio import AsyncIOMotorClient
-from info import SETTINGS, IS_PM_SEARCH, IS_SEND_MOVIE_UPDATE, PREMIUM_POINT,REF_PREMIUM,IS_VERIFY, SHORTENER_WEBSITE3, SHORTENER_API3, THREE_VERIFY_GAP, LINK_MODE, FILE_CAPTION, TUTORIAL, DATABASE_NAME, DATABASE_URI, IMDB, IMDB_TEMPLATE, PROTECT_CONTENT, AUTO_DELETE, SPELL_CHECK, AUTO_FILTER, LOG_VR_CHANNEL, SHORTENER_WEBSITE, SHORTENER_API, SHORTENER_WEBSITE2, SHORTENER_API2, TWO_VERIFY_GAP
+from info import SETTINGS, IS_PM_SEARCH, IS_SEND_MOVIE_UPDATE, PREMIUM_POINT,REF_PREMIUM,IS_VERIFY, SHORTENER_WEBSITE3, SHORTENER_API3, THREE_VERIFY_GAP, LINK_MODE, FILE_CAPTION, TUTORIAL, DATABASE_NAME, DATABASE_URI, IMDB, IMDB_TEMPLATE, PROTECT_CONTENT, AUTO_DELETE, SPELL_CHECK, AUTO_FILTER, LOG_VR_CHANNEL, SHORTENER_WEBSITE, SHORTENER_API, SHORTENER_WEBSITE2, SHORTENER_API2, TWO_VERIFY_GAP, USER_STATUS_CACHE_SIZE, USER_STATUS_CACHE_TIME
+from Spidey.util.ttl_cache import TTLCache
 from database.multi_db_manager import multi_db_manager, get_user_database
 # from utils import get_seconds
 
@@ -30,6 +31,19 @@ class Database:
         self.grp_and_ids = fsubs.grp_and_ids  # Keep this on legacy connection
         self.movies_update_channel = group_db.movies_update_channel if group_db is not None else mydb.movies_update_channel
         self.botcol = user_db.botcol if user_db is not None else mydb.botcol
+        self.imdb_cache = mydb.imdb_cache
+        self.pending_deletes = mydb.pending_deletes
+        self.broadcasts = mydb.broadcasts
+        self.broadcast_log = mydb.broadcast_log
+        # Kept in step by ban_user / remove_ban / disable_chat / re_enable_chat, the banned filters read them
+        self.banned_users = set()
+        self.disabled_chats = set()
+        # expiry_time is naive UTC everywhere, the way MongoDB hands datetimes back
+        # Called with (user_id, expiry_time) whenever premium is granted, extended or removed
+        self.premium_watchers = []
+        # user_id -> the verification doc and premium expiry every file gate reads,
+        # dropped by update_notcopy_user and premium_changed
+        self.status = TTLCache("user_status", maxsize=USER_STATUS_CACHE_SIZE, ttl=USER_STATUS_CACHE_TIME)
         
         # Fallback to legacy connections if multi-db fails
         if user_db is None:
@@ -94,10 +108,10 @@ class Database:
         if point >= PREMIUM_POINT :
             seconds = (REF_PREMIUM * 24 * 60 * 60)
             oldEx =(await self.users.find_one({'id' : id}))
-            if oldEx :
+            if oldEx and oldEx.get('expiry_time') and oldEx['expiry_time'] > datetime.datetime.utcnow():
                 expiry_time = oldEx['expiry_time'] + datetime.timedelta(seconds=seconds)
             else: 
-                expiry_time = datetime.datetime.now() + datetime.timedelta(seconds=seconds)
+                expiry_time = datetime.datetime.utcnow() + datetime.timedelta(seconds=seconds)
             user_data = {"id": id, "expiry_time": expiry_time}
             await db.update_user(user_data)
             await self.col.update_one({'id' : id} , {'$set':{'point' : 0}})
@@ -122,13 +136,24 @@ class Database:
 
     async def delete_chat(self, id):
         await self.grp.delete_many({'id': int(id)})
+
+    async def delete_users(self, user_ids):
+        await self.col.delete_many({'id': {'$in': [int(id) for id in user_ids]}})
+
+    async def delete_chats(self, ids):
+        await self.grp.delete_many({'id': {'$in': [int(id) for id in ids]}})
         
     async def get_banned(self):
-        users = self.col.find({'ban_status.is_banned': True})
-        chats = self.grp.find({'chat_status.is_disabled': True})
-        b_chats = [chat['id'] async for chat in chats]
-        b_users = [user['id'] async for user in users]
-        return b_users, b_chats
+        users = self.col.find({'ban_status.is_banned': True}, {'id': 1})
+        chats = self.grp.find({'chat_status.is_disabled': True}, {'id': 1})
+        b_chats = {int(chat['id']) async for chat in chats}
+        b_users = {int(user['id']) async for user in users}
+        # Refill in place, temp.BANNED_USERS / BANNED_CHATS are these same sets
+        self.banned_users.clear()
+        self.banned_users.update(b_users)
+        self.disabled_chats.clear()
+        self.disabled_chats.update(b_chats)
+        return self.banned_users, self.disabled_chats
     
     async def add_chat(self, chat, title):
         chat = self.new_group(chat, title)
@@ -138,6 +163,22 @@ class Database:
         chat = await self.grp.find_one({'id':int(chat)})
         return False if not chat else chat.get('chat_status')  
 
+    async def disable_chat(self, chat, reason="No Reason"):
+        chat_status = dict(
+            is_disabled=True,
+            reason=reason
+        )
+        await self.grp.update_one({'id': int(chat)}, {'$set': {'chat_status': chat_status}})
+        self.disabled_chats.add(int(chat))
+
+    async def re_enable_chat(self, id):
+        chat_status = dict(
+            is_disabled=False,
+            reason=""
+        )
+        await self.grp.update_one({'id': int(id)}, {'$set': {'chat_status': chat_status}})
+        self.disabled_chats.discard(int(id))
+
     async def update_settings(self, id, settings):
         await self.grp.update_one({'id': int(id)}, {'$set': {'settings': settings}})   
     
@@ -151,24 +192,36 @@ class Database:
     async def get_db_size(self):
         return (await mydb.command("dbstats"))['dataSize'] 
 
+    def user_status(self, user_id):
+        # Keyed by int, ids from callbacks and commands arrive as str and must hit the same entry
+        user_id = int(user_id)
+        status = self.status.get(user_id)
+        if status is None:
+            status = self.status[user_id] = {}
+        return status
+
     async def get_notcopy_user(self, user_id):
         user_id = int(user_id)
-        user = await self.misc.find_one({"user_id": user_id})
-        ist_timezone = pytz.timezone('Asia/Kolkata')
-        if not user:
-            res = {
+        status = self.user_status(user_id)
+        if "notcopy" not in status:
+            user = await self.misc.find_one({"user_id": user_id})
+            ist_timezone = pytz.timezone('Asia/Kolkata')
+            # Users who never verified get no row, update_notcopy_user creates it on the first verify
+            status["notcopy"] = {
                 "user_id": user_id,
                 "last_verified": datetime.datetime(2020, 5, 17, 0, 0, 0, tzinfo=ist_timezone),
                 "second_time_verified": datetime.datetime(2019, 5, 17, 0, 0, 0, tzinfo=ist_timezone),
+                **(user or {}),
             }
-            user = await self.misc.insert_one(res)
-        return user
+        return status["notcopy"]
 
     async def update_notcopy_user(self, user_id, value:dict):
         user_id = int(user_id)
         myquery = {"user_id": user_id}
         newvalues = {"$set": value}
-        return await self.misc.update_one(myquery, newvalues)
+        result = await self.misc.update_one(myquery, newvalues, upsert=True)
+        self.status.pop(user_id)
+        return result
 
     async def is_user_verified(self, user_id):
         user = await self.get_notcopy_user(user_id)
@@ -266,6 +319,7 @@ class Database:
             ban_reason=''
         )
         await self.col.update_one({'id': id}, {'$set': {'ban_status': ban_status}})
+        self.banned_users.discard(int(id))
     
     async def ban_user(self, user_id, ban_reason="No Reason"):
         ban_status = dict(
@@ -273,6 +327,7 @@ class Database:
             ban_reason=ban_reason
         )
         await self.col.update_one({'id': user_id}, {'$set': {'ban_status': ban_status}})
+        self.banned_users.add(int(user_id))
 
     async def get_ban_status(self, id):
         default = dict(
@@ -287,6 +342,14 @@ class Database:
         
     async def update_user(self, user_data):
         await self.users.update_one({"id": user_data["id"]}, {"$set": user_data}, upsert=True)
+        if "expiry_time" in user_data:
+            self.premium_changed(user_data["id"], user_data["expiry_time"])
+
+    def premium_changed(self, user_id, expiry_time):
+        user_id = int(user_id)
+        self.status.pop(user_id)
+        for watcher in self.premium_watchers:
+            watcher(user_id, expiry_time)
 
 
     async def get_expired(self, current_time):
@@ -298,16 +361,20 @@ class Database:
 
     
     async def has_premium_access(self, user_id):
-        user_data = await self.get_user(user_id)
-        if user_data:
-            expiry_time = user_data.get("expiry_time")
-            if expiry_time is None:
-                # User previously used the free trial, but it has ended.
-                return False
-            elif isinstance(expiry_time, datetime.datetime) and datetime.datetime.now() <= expiry_time:
-                return True
-            else:
-                await self.users.update_one({"id": user_id}, {"$set": {"expiry_time": None}})
+        user_id = int(user_id)
+        status = self.user_status(user_id)
+        if "premium" not in status:
+            user_data = await self.get_user(user_id)
+            status["premium"] = user_data.get("expiry_time") if user_data else None
+        expiry_time = status["premium"]
+        if expiry_time is None:
+            # No premium, or the free trial has ended.
+            return False
+        elif isinstance(expiry_time, datetime.datetime) and datetime.datetime.utcnow() <= expiry_time:
+            return True
+        else:
+            await self.users.update_one({"id": user_id}, {"$set": {"expiry_time": None}})
+            self.premium_changed(user_id, None)
         return False
     
     async def check_remaining_uasge(self, user_id):
@@ -315,12 +382,12 @@ class Database:
         user_data = await self.get_user(user_id)        
         expiry_time = user_data.get("expiry_time")
         # Calculate remaining time
-        remaining_time = expiry_time - datetime.datetime.now()
+        remaining_time = expiry_time - datetime.datetime.utcnow()
         return remaining_time
 
     async def all_premium_users(self):
         count = await self.users.count_documents({
-        "expiry_time": {"$gt": datetime.datetime.now()}
+        "expiry_time": {"$gt": datetime.datetime.utcnow()}
         })
         return count
 
@@ -334,9 +401,11 @@ class Database:
             return False
 
     async def remove_premium_access(self, user_id):
-        return await self.update_one(
+        removed = await self.update_one(
             {"id": user_id}, {"$set": {"expiry_time": None}}
         )
+        self.premium_changed(user_id, None)
+        return removed
                 
 
     async def check_trial_status(self, user_id):
@@ -363,9 +432,10 @@ class Database:
         #await set_free_trial_status(user_id)
         user_id = user_id
         seconds = 5*60         
-        expiry_time = datetime.datetime.now() + datetime.timedelta(seconds=seconds)
+        expiry_time = datetime.datetime.utcnow() + datetime.timedelta(seconds=seconds)
         user_data = {"id": user_id, "expiry_time": expiry_time, "has_free_trial": True}
         await self.users.update_one({"id": user_id}, {"$set": user_data}, upsert=True)
+        self.premium_changed(user_id, expiry_time)
             
      # spidey BOTS = @IM_spidey
     async def spidey_set_ads_link(self,link):
@@ -476,6 +546,17 @@ class Database:
         user = await self.col.find_one({'id': int(id)})
         return user.get('save', False) 
     
+    async def get_imdb_cache(self, key):
+        # Returns the cache document, its 'data' is None for a cached miss
+        cached = await self.imdb_cache.find_one({'_id': key})
+        if cached and cached['expire_at'] > datetime.datetime.utcnow():
+            return cached
+        return None
+
+    async def set_imdb_cache(self, key, data, ttl):
+        expire_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=ttl)
+        await self.imdb_cache.update_one({'_id': key}, {'$set': {'data': data, 'expire_at': expire_at}}, upsert=True)
+
 db = Database()
 
 
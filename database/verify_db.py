@@ -1,21 +1,44 @@
 from os import environ
 from datetime import timedelta, datetime
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
 import pytz
-from info import DATABASE_URI, DATABASE_NAME
+from info import DATABASE_URI, DATABASE_NAME, VERIFY_EVENTS_TIME
+
+PERIODS = ("today", "yesterday", "this_week", "this_month", "last_month")
 
 class VR_db:
     def __init__(self, db_url, db_name, timezone):
-        self.client = MongoClient(db_url)
+        self.client = AsyncIOMotorClient(db_url)
         self.db = self.client[db_name]
         self.collection = self.db.verifications
+        # One {_id: "YYYY-MM-DD", count} document per day, the stats panel sums these
+        self.days = self.db.verification_days
         self.timezone = pytz.timezone(timezone)
 
+    async def start(self):
+        """Expires raw events after VERIFY_EVENTS_TIME and makes sure every day they
+        cover is counted, events saved before the daily counters existed included."""
+        try:
+            await self.collection.create_index("verified_at", expireAfterSeconds=VERIFY_EVENTS_TIME)
+        except OperationFailure:
+            # The TTL changed since the index was built
+            await self.db.command("collMod", self.collection.name, index={"keyPattern": {"verified_at": 1}, "expireAfterSeconds": VERIFY_EVENTS_TIME})
+        days = self.collection.aggregate([
+            {"$group": {"_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$verified_at", "timezone": self.timezone.zone}}, "count": {"$sum": 1}}},
+        ])
+        # Counters never fall behind the events they were bumped with, $max keeps this safe to rerun
+        updates = [UpdateOne({"_id": day["_id"]}, {"$max": {"count": day["count"]}}, upsert=True) async for day in days]
+        if updates:
+            await self.days.bulk_write(updates, ordered=False)
+
     async def save_verification(self, user_id):
         now = datetime.now(self.timezone)
         year = now.year  
         verification = {"user_id": user_id, "verified_at": now, "year": year}
-        self.collection.insert_one(verification)
+        await self.collection.insert_one(verification)
+        await self.days.update_one({"_id": now.strftime("%Y-%m-%d")}, {"$inc": {"count": 1}}, upsert=True)
 
     def get_start_end_dates(self, time_period, year=None):
         now = datetime.now(self.timezone)
@@ -25,7 +48,7 @@ class VR_db:
             end_datetime = now
         elif time_period == 'yesterday':
             start_datetime = (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-            end_datetime = start_datetime + timedelta(days=1)
+            end_datetime = start_datetime + timedelta(days=1) - timedelta(microseconds=1)
         elif time_period == 'this_week':
             start_datetime = now - timedelta(days=now.weekday())
             start_datetime = start_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -46,10 +69,28 @@ class VR_db:
         
         return start_datetime, end_datetime
 
-    async def get_vr_count(self, time_period, year=None):
+    def day_range(self, time_period, year=None):
         start_datetime, end_datetime = self.get_start_end_dates(time_period, year)
-        count = self.collection.count_documents({'verified_at': {'$gt': start_datetime, '$lt': end_datetime}})
-        return count
+        return start_datetime.strftime("%Y-%m-%d"), end_datetime.strftime("%Y-%m-%d")
+
+    async def count_days(self, first, last):
+        return {day["_id"]: day["count"] async for day in self.days.find({"_id": {"$gte": first, "$lte": last}})}
+
+    async def get_vr_count(self, time_period, year=None):
+        first, last = self.day_range(time_period, year)
+        return sum((await self.count_days(first, last)).values())
+
+    async def get_vr_counts(self):
+        """Every period of the stats panel from one read of at most two years of daily counts."""
+        this_year = datetime.now(self.timezone).year
+        ranges = {period: self.day_range(period) for period in PERIODS}
+        ranges["this_year"] = self.day_range("year", this_year)
+        ranges["last_year"] = self.day_range("year", this_year - 1)
+        days = await self.count_days(ranges["last_year"][0], ranges["this_year"][1])
+        return {
+            period: sum(count for day, count in days.items() if first <= day <= last)
+            for period, (first, last) in ranges.items()
+        }
 
 vr_db = VR_db(DATABASE_URI, DATABASE_NAME, 'Asia/Kolkata')
           
@@ -53,6 +53,10 @@ auth_channel = environ.get('AUTH_CHANNEL', '-1001959922658')
 SUPPORT_GROUP = int(environ.get('SUPPORT_GROUP', '-1002294764885'))
 request_channel = environ.get('REQUEST_CHANNEL', '-1002294764885') # If anyone sends a request message to your bot, you will get it in this channel.
 MOVIE_UPDATE_CHANNEL = int(environ.get('MOVIE_UPDATE_CHANNEL', '-1002470391435'))
+MOVIE_UPDATE_DELAY = int(environ.get('MOVIE_UPDATE_DELAY', 60)) # Seconds a title waits for more files before its update is posted
+MOVIE_UPDATE_RATE = int(environ.get('MOVIE_UPDATE_RATE', 20)) # Updates posted per minute at most
+MOVIE_UPDATE_CACHE_SIZE = int(environ.get('MOVIE_UPDATE_CACHE_SIZE', 20000)) # Posted titles remembered so re-uploads don't post again
+MOVIE_UPDATE_CACHE_TIME = int(environ.get('MOVIE_UPDATE_CACHE_TIME', 7 * 86400))
 SUPPORT_CHAT = environ.get('SUPPORT_CHAT', 'https://t.me/SPIDEYOFFICIAL_777') #Support group link ( make sure bot is admin )
 FILE_STORE_CHANNEL = int(environ.get('FILE_STORE_CHANNEL', '-1002294764885'))
 PUBLIC_FILE_STORE = int(environ.get('PUBLIC_FILE_STORE', '-1002294764885'))
@@ -82,6 +86,7 @@ SHORTENER_API3 = environ.get("SHORTENER_API3", "")
 SHORTENER_WEBSITE3 = environ.get("SHORTENER_WEBSITE3", '')
 TWO_VERIFY_GAP = int(environ.get('TWO_VERIFY_GAP', "14400"))
 THREE_VERIFY_GAP = int(environ.get('THREE_VERIFY_GAP', "14400"))
+VERIFY_EVENTS_TIME = int(environ.get('VERIFY_EVENTS_TIME', 90 * 86400)) # Seconds single verification events are kept, daily counts stay forever
 #---------------------------------------------------------------
 #---------------------------------------------------------------
 LANGUAGES = ["hindi", "english", "telugu", "tamil", "kannada", "malayalam", "bengali", "marathi", "gujarati", "punjabi", "marathi"]
@@ -105,6 +110,26 @@ MELCOW_NEW_USERS = is_enabled((environ.get('MELCOW_NEW_USERS', "True")), True)
 # Bot Settings Configuration
 # ============================
 CACHE_TIME = int(environ.get('CACHE_TIME', 300))
+SETTINGS_CACHE_TIME = int(environ.get('SETTINGS_CACHE_TIME', 600)) # Seconds a group's settings are served from memory
+SEARCH_STATS_FLUSH_TIME = int(environ.get('SEARCH_STATS_FLUSH_TIME', 60)) # Seconds between saves of the most searched sketches
+SEARCH_CACHE_SIZE = int(environ.get('SEARCH_CACHE_SIZE', 5000)) # Searches whose buttons and results are kept for paging
+SEARCH_CACHE_TIME = int(environ.get('SEARCH_CACHE_TIME', 6 * 3600)) # Seconds a search stays pageable
+SEARCH_CACHE_BYTES = int(environ.get('SEARCH_CACHE_BYTES', 64 * 1024 * 1024))
+FILE_LABEL_CACHE_SIZE = int(environ.get('FILE_LABEL_CACHE_SIZE', 20000)) # Result button labels kept per file and link mode
+FILE_LABEL_CACHE_TIME = int(environ.get('FILE_LABEL_CACHE_TIME', 24 * 3600))
+FSUB_CACHE_SIZE = int(environ.get('FSUB_CACHE_SIZE', 100000)) # MULTI_FSUB memberships kept in memory
+FSUB_CACHE_TIME = int(environ.get('FSUB_CACHE_TIME', 3600)) # Seconds a membership is trusted without a chat member update
+FSUB_NEGATIVE_CACHE_TIME = int(environ.get('FSUB_NEGATIVE_CACHE_TIME', 30))
+USER_STATUS_CACHE_SIZE = int(environ.get('USER_STATUS_CACHE_SIZE', 50000)) # Users whose verification and premium status are kept in memory
+USER_STATUS_CACHE_TIME = int(environ.get('USER_STATUS_CACHE_TIME', 3600)) # Seconds a status is trusted, changes made by this bot drop it at once
+VERIFY_GUARD_CACHE_TIME = int(environ.get('VERIFY_GUARD_CACHE_TIME', 60)) # Seconds the send guard trusts a verification answer
+LOOP_GUARD = is_enabled(environ.get('LOOP_GUARD', "False"), False) # Debug only, logs where the event loop gets blocked
+LOOP_GUARD_THRESHOLD = float(environ.get('LOOP_GUARD_THRESHOLD', 0.1))
+LAZY_PLUGINS = is_enabled(environ.get('LAZY_PLUGINS', "True"), True) # Import command only plugins/Extra modules on their first command
+BROADCAST_WORKERS = int(environ.get('BROADCAST_WORKERS', 20)) # Sends in flight at once per broadcast
+BROADCAST_RATE = float(environ.get('BROADCAST_RATE', 25)) # API calls per second per bot, Telegram allows about 30
+BROADCAST_PROGRESS_TIME = int(environ.get('BROADCAST_PROGRESS_TIME', 10)) # Seconds between progress edits
+MULTI_BROADCAST = is_enabled(environ.get('MULTI_BROADCAST', "False"), False) # Also send through the MULTI_TOKEN bots, only when users started them all and they sit in the groups
 USE_CAPTION_FILTER = bool(environ.get('USE_CAPTION_FILTER', True))
 #---------------------------------------------------------------
 #---------------------------------------------------------------
@@ -132,6 +157,9 @@ IMDB = is_enabled('IMDB', True)
 FILE_CAPTION = environ.get('FILE_CAPTION', f'{script.FILE_CAPTION}')
 IMDB_TEMPLATE = environ.get('IMDB_TEMPLATE', f'{script.IMDB_TEMPLATE_TXT}')
 LONG_IMDB_DESCRIPTION = is_enabled('LONG_IMDB_DESCRIPTION', False)
+IMDB_WORKERS = int(environ.get('IMDB_WORKERS', 4)) # Threads doing the blocking IMDb lookups
+IMDB_CACHE_TIME = int(environ.get('IMDB_CACHE_TIME', 7 * 86400)) # Seconds IMDb results are cached
+IMDB_NEGATIVE_CACHE_TIME = int(environ.get('IMDB_NEGATIVE_CACHE_TIME', 86400)) # Seconds a title with no IMDb match is cached
 PROTECT_CONTENT = is_enabled('PROTECT_CONTENT', False)
 SPELL_CHECK = is_enabled('SPELL_CHECK', True)
 LINK_MODE = is_enabled('LINK_MODE', False)
@@ -152,6 +180,15 @@ STREAM_MODE = bool(environ.get('STREAM_MODE', True)) # Set True or Flase
 # Online Stream and Download
 
 MULTI_CLIENT = False
+# Stream limits, rates are in bytes per second and 0 disables a limit
+STREAM_RATE_GLOBAL = int(environ.get('STREAM_RATE_GLOBAL', '0'))
+STREAM_RATE_PER_IP = int(environ.get('STREAM_RATE_PER_IP', '0'))
+STREAM_MAX_CONNECTIONS = int(environ.get('STREAM_MAX_CONNECTIONS', '0'))
+# Reverse proxies whose X-Forwarded-For is believed, behind one every client looks like the proxy without this
+TRUSTED_PROXIES = environ.get('TRUSTED_PROXIES', '').split()
+# Off by default until TRUSTED_PROXIES is set, behind Heroku/Koyeb/Render it would cap the whole site
+STREAM_MAX_CONNECTIONS_PER_IP = int(environ.get('STREAM_MAX_CONNECTIONS_PER_IP', '8' if TRUSTED_PROXIES else '0'))
+STATS_TOKEN = environ.get('STATS_TOKEN', '') # /stats?token=... shows per IP, per file and cache detail, without it only totals
 SLEEP_THRESHOLD = int(environ.get('SLEEP_THRESHOLD', '60'))
 PING_INTERVAL = int(environ.get("PING_INTERVAL", "1200"))  # 20 minutes
 if 'DYNO' in environ:
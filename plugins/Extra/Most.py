@@ -3,6 +3,8 @@ from pyrogram import Client, filters
 from pyrogram.types import ReplyKeyboardMarkup
 from database.config_db import mdb
 
+WINDOWS = ("today", "week")
+
 # most search commands
 @Client.on_message(filters.command('most'))
 async def most(client, message):
@@ -10,12 +12,15 @@ async def most(client, message):
     def is_alphanumeric(string):
         return bool(re.match('^[a-zA-Z0-9 ]*$', string))
     
+    # Optional window, /most today or /most week 10
+    args = message.command[1:]
+    window = args.pop(0) if args and args[0] in WINDOWS else None
     try:
-        limit = int(message.command[1])
+        limit = int(args[0])
     except (IndexError, ValueError):
         limit = 20
 
-    top_messages = await mdb.get_top_messages(limit)
+    top_messages = await mdb.get_top_messages(limit, window)
 
     # Use a set to ensure unique messages (case sensitive).
     seen_messages = set()
@@ -50,17 +55,19 @@ async def trendlist(client, message):
 
     # Set the limit to the default if no argument is provided
     limit = 31
+    args = message.command[1:]
+    window = args.pop(0) if args and args[0] in WINDOWS else None
 
     # Check if an argument is provided and if it's a valid number
-    if len(message.command) > 1:
+    if args:
         try:
-            limit = int(message.command[1])
+            limit = int(args[0])
         except ValueError:
             await message.reply_text("Invalid number format.\nPlease provide a valid number after the /trendlist command.")
             return  # Exit the function if the argument is not a valid integer
 
     try:
-        top_messages = await mdb.get_top_messages(limit)
+        top_messages = await mdb.get_top_messages(limit, window)
     except Exception as e:
         await message.reply_text(f"Error retrieving messages: {str(e)}")
         return  # Exit the function if there is an error retrieving messages
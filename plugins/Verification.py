@@ -3,17 +3,13 @@ from pyrogram.errors import MessageNotModified
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery
 from database.verify_db import vr_db 
 from info import ADMINS
-from datetime import datetime
 
 @Client.on_message(filters.command("verification") & filters.private & filters.user(ADMINS))
 async def vrfs(client, message):
-    today = await vr_db.get_vr_count("today")
-    yesterday = await vr_db.get_vr_count("yesterday")
-    this_week = await vr_db.get_vr_count("this_week")
-    this_month = await vr_db.get_vr_count("this_month")
-    last_month = await vr_db.get_vr_count("last_month")
-    this_year = await vr_db.get_vr_count("year", year=datetime.now().year)
-    last_year = await vr_db.get_vr_count("year", year=datetime.now().year - 1)
+    counts = await vr_db.get_vr_counts()
+    today, yesterday, this_week = counts['today'], counts['yesterday'], counts['this_week']
+    this_month, last_month = counts['this_month'], counts['last_month']
+    this_year, last_year = counts['this_year'], counts['last_year']
 
     btn = [[
         InlineKeyboardButton("ᴛᴏᴅᴀʏ", callback_data=f'vrrfrs#tud'), 
@@ -63,13 +59,10 @@ async def vr_ref(client, query):
         pass 
         
     # Refresh the data
-    today = await vr_db.get_vr_count("today")
-    yesterday = await vr_db.get_vr_count("yesterday")
-    this_week = await vr_db.get_vr_count("this_week")
-    this_month = await vr_db.get_vr_count("this_month")
-    last_month = await vr_db.get_vr_count("last_month")
-    this_year = await vr_db.get_vr_count("year", year=datetime.now().year)
-    last_year = await vr_db.get_vr_count("year", year=datetime.now().year - 1)
+    counts = await vr_db.get_vr_counts()
+    today, yesterday, this_week = counts['today'], counts['yesterday'], counts['this_week']
+    this_month, last_month = counts['this_month'], counts['last_month']
+    this_year, last_year = counts['this_year'], counts['last_year']
     
     btn = [[
         InlineKeyboardButton("ᴛᴏᴅᴀʏ", callback_data=f'vrrfrs#tud'), 
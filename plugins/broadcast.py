@@ -1,104 +1,42 @@
 from pyrogram import Client, filters
-import datetime
-import time
-from database.users_chats_db import db
 from info import ADMINS
-from utils import users_broadcast, groups_broadcast, temp, get_readable_time
-import asyncio
-from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup 
+from Spidey.bot.broadcast import broadcast_jobs, RUNNING, PAUSED, CANCELLED
+from pyrogram.types import ReplyKeyboardMarkup
 
-lock = asyncio.Lock()
+@Client.on_callback_query(filters.regex(r'^broadcast#'))
+async def broadcast_status(bot, query):
+    _, status, job_id = query.data.split("#")
+    if query.from_user.id not in ADMINS or status not in (RUNNING, PAUSED, CANCELLED):
+        return await query.answer("This is not for you.", show_alert=True)
+    job = await broadcast_jobs.set_status(job_id, status)
+    if job is None:
+        return await query.answer("This broadcast already ended.", show_alert=True)
+    await query.answer({RUNNING: "Resuming...", PAUSED: "Pausing...", CANCELLED: "Cancelling..."}[status])
+
+async def ask_pin(message, where):
+    msg = await message.ask(f'<b>Do you want pin this message in {where}?</b>', reply_markup=ReplyKeyboardMarkup([['Yes', 'No']], one_time_keyboard=True, resize_keyboard=True))
+    if msg.text not in ('Yes', 'No'):
+        await msg.edit('Wrong Response!')
+        return None
+    await msg.delete()
+    return msg.text == 'Yes'
 
-@Client.on_callback_query(filters.regex(r'^broadcast_cancel'))
-async def broadcast_cancel(bot, query):
-    _, ident = query.data.split("#")
-    if ident == 'users':
-        await query.message.edit("ᴛʀʏɪɴɢ ᴛᴏ ᴄᴀɴᴄᴇʟ ᴜsᴇʀs ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ...")
-        temp.USERS_CANCEL = True
-    elif ident == 'groups':
-        temp.GROUPS_CANCEL = True
-        await query.message.edit("ᴛʀʏɪɴɢ ᴛᴏ ᴄᴀɴᴄᴇʟ ɢʀᴏᴜᴘs ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ...")
-       
 @Client.on_message(filters.command("broadcast") & filters.user(ADMINS) & filters.reply)
 async def broadcast_users(bot, message):
-    if lock.locked():
+    if await broadcast_jobs.busy():
         return await message.reply('Currently broadcast processing, Wait for complete.')
-
-    msg = await message.ask('<b>Do you want pin this message in users?</b>', reply_markup=ReplyKeyboardMarkup([['Yes', 'No']], one_time_keyboard=True, resize_keyboard=True))
-    if msg.text == 'Yes':
-        is_pin = True
-    elif msg.text == 'No':
-        is_pin = False
-    else:
-        return await msg.edit('Wrong Response!')
-    await msg.delete()
-    users = await db.get_all_users()
-    b_msg = message.reply_to_message
+    is_pin = await ask_pin(message, 'users')
+    if is_pin is None:
+        return
     b_sts = await message.reply_text(text='<b>ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ ʏᴏᴜʀ ᴍᴇssᴀɢᴇs ᴛᴏ ᴜsᴇʀs ⌛️</b>')
-    start_time = time.time()
-    total_users = await db.total_users_count()
-    done = 0
-    blocked = 0
-    deleted = 0
-    failed = 0
-    success = 0
-
-    async with lock:
-        async for user in users:
-            time_taken = get_readable_time(time.time()-start_time)
-            if temp.USERS_CANCEL:
-                temp.USERS_CANCEL = False
-                await b_sts.edit(f"Users broadcast Cancelled!\nCompleted in {time_taken}\n\nTotal Users: <code>{total_users}</code>\nCompleted: <code>{done} / {total_users}</code>\nSuccess: <code>{success}</code>")
-                return
-            sts = await users_broadcast(int(user['id']), b_msg, is_pin)
-            if sts == 'Success':
-                success += 1
-            elif sts == 'Error':
-                failed += 1
-            done += 1
-            if not done % 20:
-                btn = [[
-                    InlineKeyboardButton('CANCEL', callback_data=f'broadcast_cancel#users')
-                ]]
-                await b_sts.edit(f"Users broadcast in progress...\n\nTotal Users: <code>{total_users}</code>\nCompleted: <code>{done} / {total_users}</code>\nSuccess: <code>{success}</code>", reply_markup=InlineKeyboardMarkup(btn))
-        await b_sts.edit(f"Users broadcast completed.\nCompleted in {time_taken}\n\nTotal Users: <code>{total_users}</code>\nCompleted: <code>{done} / {total_users}</code>\nSuccess: <code>{success}</code>")
+    await broadcast_jobs.create('users', message.reply_to_message, is_pin, b_sts)
 
 @Client.on_message(filters.command("grp_broadcast") & filters.user(ADMINS) & filters.reply)
 async def broadcast_group(bot, message):
-    msg = await message.ask('<b>Do you want pin this message in groups?</b>', reply_markup=ReplyKeyboardMarkup([['Yes', 'No']], one_time_keyboard=True, resize_keyboard=True))
-    if msg.text == 'Yes':
-        is_pin = True
-    elif msg.text == 'No':
-        is_pin = False
-    else:
-        return await msg.edit('Wrong Response!')
-    await msg.delete()
-    chats = await db.get_all_chats()
-    b_msg = message.reply_to_message
+    if await broadcast_jobs.busy():
+        return await message.reply('Currently broadcast processing, Wait for complete.')
+    is_pin = await ask_pin(message, 'groups')
+    if is_pin is None:
+        return
     b_sts = await message.reply_text(text='<b>ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ ʏᴏᴜʀ ᴍᴇssᴀɢᴇs ᴛᴏ ɢʀᴏᴜᴘs ⏳</b>')
-    start_time = time.time()
-    total_chats = await db.total_chat_count()
-    done = 0
-    failed = 0
-    success = 0
-    
-    async with lock:
-        async for chat in chats:
-            time_taken = get_readable_time(time.time()-start_time)
-            if temp.GROUPS_CANCEL:
-                temp.GROUPS_CANCEL = False
-                await b_sts.edit(f"Groups broadcast Cancelled!\nCompleted in {time_taken}\n\nTotal Groups: <code>{total_chats}</code>\nCompleted: <code>{done} / {total_chats}</code>\nSuccess: <code>{success}</code>\nFailed: <code>{failed}</code>")
-                return
-            sts = await groups_broadcast(int(chat['id']), b_msg, is_pin)
-            if sts == 'Success':
-                success += 1
-            elif sts == 'Error':
-                failed += 1
-            done += 1
-            if not done % 20:
-                btn = [[
-                    InlineKeyboardButton('CANCEL', callback_data=f'broadcast_cancel#groups')
-                ]]
-                await b_sts.edit(f"Groups groadcast in progress...\n\nTotal Groups: <code>{total_chats}</code>\nCompleted: <code>{done} / {total_chats}</code>\nSuccess: <code>{success}</code>\nFailed: <code>{failed}</code>", reply_markup=InlineKeyboardMarkup(btn))    
-        await b_sts.edit(f"Groups broadcast completed.\nCompleted in {time_taken}\n\nTotal Groups: <code>{total_chats}</code>\nCompleted: <code>{done} / {total_chats}</code>\nSuccess: <code>{success}</code>\nFailed: <code>{failed}</code>")
-
+    await broadcast_jobs.create('groups', message.reply_to_message, is_pin, b_sts)
@@ -1,13 +1,17 @@
 from pyrogram import Client, filters
+from pyrogram.errors import FloodWait
 from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-from info import CHANNELS, MOVIE_UPDATE_CHANNEL, ADMINS, LOG_CHANNEL
+from info import CHANNELS, MOVIE_UPDATE_CHANNEL, ADMINS, LOG_CHANNEL, MOVIE_UPDATE_DELAY, MOVIE_UPDATE_RATE, MOVIE_UPDATE_CACHE_SIZE, MOVIE_UPDATE_CACHE_TIME
 from database.ia_filterdb import save_file, unpack_new_file_id
 from utils import get_poster, temp
+from Spidey.bot.broadcast import TokenBucket
+from Spidey.util.ttl_cache import TTLCache
 import re
+import time
+import asyncio
 from database.users_chats_db import db
 from Script import script  
 
-processed_movies = set()
 media_filter = filters.document | filters.video
 
 @Client.on_message(filters.chat(CHANNELS) & media_filter)
@@ -20,7 +24,7 @@ async def media(bot, message):
         success_sts = await save_file(media)
         if success_sts == 'suc' and await db.get_send_movie_update_status(bot_id):
             file_id, file_ref = unpack_new_file_id(media.file_id)
-            await send_movie_updates(bot, file_name=media.file_name, caption=media.caption, file_id=file_id)
+            await movie_updates.add(bot, file_name=media.file_name, caption=media.caption, file_id=file_id)
 
 async def get_imdb(file_name):
     imdb_file_name = await movie_name_format(file_name)
@@ -59,86 +63,145 @@ async def movie_name_format(file_name):
                       .replace('!', '')).strip()
     return filename
 
-async def check_qualities(text, qualities: list):
-    quality = []
-    for q in qualities:
-        if q in text:
-            quality.append(q)
-    quality = ", ".join(quality)
-    return quality[:-2] if quality.endswith(", ") else quality
-
-async def send_movie_updates(bot, file_name, caption, file_id):
-    try:
+async def update_title(file_name, caption):
+    """The title an update is posted under, cut after the year or season so every episode shares it."""
+    year_match = re.search(r"\b(19|20)\d{2}\b", caption) if caption else None
+    if not year_match:
+        year_match = re.search(r"\b(19|20)\d{2}\b", file_name.replace('.', ' ').replace('_', ' '))
+    year = year_match.group(0) if year_match else None      
+    pattern = r"(?i)(?:s|season)0*(\d{1,2})"
+    season = re.search(pattern, caption) if caption else None
+    if not season:
+        season = re.search(pattern, file_name) if file_name else None 
+
+    if file_name and year and year in file_name:
+        file_name = file_name[:file_name.find(year) + 4]
+
+    if file_name and season and season.group(1) in file_name:
+        file_name = file_name[:file_name.find(season.group(1)) + 1]
+
+    return await movie_name_format(file_name)
+
+async def send_movie_updates(bot, movie_name, file_id):
+    poster_url, rating, genres, votes, description, runtime, director, actors, release_date, box_office, country = await get_imdb(movie_name)
+
+    caption_message = script.MOVIES_UPDATE_TXT.format(
+        title=movie_name,
+        genres=genres,
+        rating=rating,
+        votes=votes,
+        description=description,
+        runtime=runtime,
+        director=director,
+        actors=actors,
+        release_date=release_date,
+        box_office=box_office,
+        country=country
+    )
+
+    movie_update_channel = await db.movies_update_channel_id()    
+
+    btn = [[
+        InlineKeyboardButton('📂 ɢᴇᴛ ғɪʟᴇ 📂', url=f'https://telegram.me/{temp.U_NAME}?start={file_id}')
+    ],[
+        InlineKeyboardButton('♻️ ʜᴏᴡ ᴛᴏ ᴅᴏᴡɴʟᴏᴀᴅ ♻️', url='https://t.me/spideyofficial_777/12')
+    ]]
+    reply_markup = InlineKeyboardMarkup(btn)
+
+    if poster_url:
+        await bot.send_photo(movie_update_channel if movie_update_channel else MOVIE_UPDATE_CHANNEL, 
+                             photo=poster_url, caption=caption_message, reply_markup=reply_markup)
+    else:
+        no_poster = "https://telegra.ph/file/88d845b4f8a024a71465d.jpg"
+        await bot.send_photo(movie_update_channel if movie_update_channel else MOVIE_UPDATE_CHANNEL, 
+                             photo=no_poster, caption=caption_message, reply_markup=reply_markup)  
+
+
+class MovieUpdates:
+    def __init__(self, delay, rate):
+        """Posts one update per title from a queue instead of one per saved file.
+        attributes:
+            pending: normalized title -> the update waiting to be posted, every file of the
+                same title arriving within `delay` seconds pushes the post back again, but
+                never past 3 * `delay` after the first one.
+            posted: titles announced successfully, so re-uploads don't post twice.
+            limiter: paces the posts to `rate` a minute, FloodWait pauses it.
+            wakeup: set when a new title is queued.
+
+        functions:
+            add: queues a saved file, the publisher starts with the first one and again
+                after it stopped.
+            run: posts every title whose window closed, oldest first.
+        """
+        self.delay = delay
+        self.pending = {}
+        self.posted = TTLCache("movie_updates", maxsize=MOVIE_UPDATE_CACHE_SIZE, ttl=MOVIE_UPDATE_CACHE_TIME)
+        self.limiter = TokenBucket(rate / 60, capacity=1)
+        self.wakeup = None
+        self.task = None
+
+    async def add(self, bot, file_name, caption, file_id):
         if not file_name:
             print("Error: file_name is None!")
             return
-        
-        year_match = re.search(r"\b(19|20)\d{2}\b", caption) if caption else None
-        year = year_match.group(0) if year_match else None      
-        pattern = r"(?i)(?:s|season)0*(\d{1,2})"
-        season = re.search(pattern, caption) if caption else None
-        if not season:
-            season = re.search(pattern, file_name) if file_name else None 
-
-        if file_name and year and year in file_name:
-            file_name = file_name[:file_name.find(year) + 4]
-
-        if file_name and season and season.group(1) in file_name:
-            file_name = file_name[:file_name.find(season.group(1)) + 1]
-
-        qualities = ["ORG", "org", "hdcam", "HDCAM", "HQ", "hq", "HDRip", "hdrip", 
-                     "camrip", "WEB-DL", "CAMRip", "hdtc", "predvd", "DVDscr", "dvdscr", 
-                     "dvdrip", "dvdscr", "HDTC", "dvdscreen", "HDTS", "hdts"]
-        quality = await check_qualities(caption, qualities) if caption else "HDRip"
-
-        language = ""
-        nb_languages = ["Hindi", "Bengali", "English", "Marathi", "Tamil", "Telugu", 
-                        "Malayalam", "Kannada", "Punjabi", "Gujrati", "Korean", "Japanese", 
-                        "Bhojpuri", "Dual", "Multi"]    
-        for lang in nb_languages:
-            if caption and lang.lower() in caption.lower():
-                language += f"{lang}, "
-        language = language.strip(", ") or "Not Idea"
-
-        movie_name = await movie_name_format(file_name)    
-
-        if movie_name in processed_movies and "movie" not in movie_name.lower():
-            return 
-        processed_movies.add(movie_name)        
-        
-        poster_url, rating, genres, votes, description, runtime, director, actors, release_date, box_office, country = await get_imdb(movie_name)
-
-        caption_message = script.MOVIES_UPDATE_TXT.format(
-            title=movie_name,
-            genres=genres,
-            rating=rating,
-            votes=votes,
-            description=description,
-            runtime=runtime,
-            director=director,
-            actors=actors,
-            release_date=release_date,
-            box_office=box_office,
-            country=country
-        )
-
-        search_movie = movie_name.replace(" ", '-')
-        movie_update_channel = await db.movies_update_channel_id()    
-
-        btn = [[
-            InlineKeyboardButton('📂 ɢᴇᴛ ғɪʟᴇ 📂', url=f'https://telegram.me/{temp.U_NAME}?start={file_id}')
-        ],[
-            InlineKeyboardButton('♻️ ʜᴏᴡ ᴛᴏ ᴅᴏᴡɴʟᴏᴀᴅ ♻️', url='https://t.me/spideyofficial_777/12')
-        ]]
-        reply_markup = InlineKeyboardMarkup(btn)
-
-        if poster_url:
-            await bot.send_photo(movie_update_channel if movie_update_channel else MOVIE_UPDATE_CHANNEL, 
-                                 photo=poster_url, caption=caption_message, reply_markup=reply_markup)
-        else:
-            no_poster = "https://telegra.ph/file/88d845b4f8a024a71465d.jpg"
-            await bot.send_photo(movie_update_channel if movie_update_channel else MOVIE_UPDATE_CHANNEL, 
-                                 photo=no_poster, caption=caption_message, reply_markup=reply_markup)  
-    except Exception as e:
-        print('Failed to send movie update. Error - ', e)
-        await bot.send_message(LOG_CHANNEL, f'Failed to send movie update. Error - {e}')
+        movie_name = await update_title(file_name, caption)
+        key = " ".join(movie_name.lower().split())
+        now = time.monotonic()
+        if key in self.pending:
+            update = self.pending[key]
+            update['due'] = min(now + self.delay, update['first'] + 3 * self.delay)
+            return
+        if key in self.posted and "movie" not in key:
+            return
+        self.pending[key] = {'key': key, 'title': movie_name, 'file_id': file_id, 'first': now, 'due': now + self.delay}
+        if self.task is None:
+            self.wakeup = asyncio.Event()
+            self.task = asyncio.create_task(self.run(bot))
+            self.task.add_done_callback(self.stopped)
+        self.wakeup.set()
+
+    def stopped(self, task):
+        # Let the next saved file start a fresh publisher instead of queueing forever
+        self.task = None
+        if not task.cancelled() and task.exception():
+            print('Movie update publisher stopped. Error - ', task.exception())
+
+    async def run(self, bot):
+        while True:
+            due = min((update['due'] for update in self.pending.values()), default=None)
+            timeout = None if due is None else due - time.monotonic()
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self.wakeup.clear()
+                continue
+            now = time.monotonic()
+            for key in [key for key, update in self.pending.items() if update['due'] <= now]:
+                update = self.pending.pop(key)
+                await self.limiter.acquire()
+                await self.publish(bot, update)
+
+    async def publish(self, bot, update):
+        for attempt in range(2):
+            try:
+                await send_movie_updates(bot, update['title'], update['file_id'])
+                # Only a title that made it out is skipped from now on, a failed one posts with its next file
+                self.posted[update['key']] = True
+                return
+            except FloodWait as e:
+                error = e
+                self.limiter.pause(e.value)
+                await self.limiter.acquire()
+            except Exception as e:
+                error = e
+                break
+        print('Failed to send movie update. Error - ', error)
+        try:
+            await bot.send_message(LOG_CHANNEL, f'Failed to send movie update. Error - {error}')
+        except Exception:
+            pass
+
+
+movie_updates = MovieUpdates(MOVIE_UPDATE_DELAY, MOVIE_UPDATE_RATE)
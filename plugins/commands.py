@@ -13,6 +13,8 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup , ForceRep
 from database.ia_filterdb import Media, get_file_details, get_bad_files, unpack_new_file_id
 from database.users_chats_db import db
 from database.config_db import mdb
+from database.verify_db import vr_db
+from database.delete_scheduler import delete_scheduler
 from database.topdb import SpideyDB
 from database.Spideyreferdb import referdb
 from plugins.pm_filter import auto_filter
@@ -68,6 +70,7 @@ async def start(client:Client, message):
         current_time = dt.now(tz=ist_timezone)
         result = await db.update_notcopy_user(user_id, {key:current_time})
         await db.update_verify_id_info(user_id, verify_id, {"verified":True})
+        await vr_db.save_verification(user_id)
         if key == "third_time_verified": 
             num = 3 
         else: 
@@ -98,7 +101,7 @@ async def start(client:Client, message):
         if user_id == message.from_user.id:
             await message.reply_text("Hᴇʏ ᴅᴜᴅᴇ, ʏᴏᴜ ᴄᴀɴ ɴᴏᴛ ʀᴇғᴇʀ ʏᴏᴜʀsᴇʟғ⁉️")
             return
-        if referdb.is_user_in_list(message.from_user.id):
+        if await referdb.is_user_in_list(message.from_user.id):
             await message.reply_text("‼️ Yᴏᴜ ʜᴀᴠᴇ ʙᴇᴇɴ ᴀʟʀᴇᴀᴅʏ ɪɴᴠɪᴛᴇᴅ ᴏʀ ᴊᴏɪɴᴇᴅ")
             return
         if await db.is_user_exist(message.from_user.id): 
@@ -108,15 +111,15 @@ async def start(client:Client, message):
             uss = await client.get_users(user_id)
         except Exception:
             return
-        referdb.add_user(message.from_user.id)
-        fromuse = referdb.get_refer_points(user_id) + 10
+        await referdb.add_user(message.from_user.id)
+        fromuse = await referdb.get_refer_points(user_id) + 10
         if fromuse == 100:
-            referdb.add_refer_points(user_id, 0) 
+            await referdb.add_refer_points(user_id, 0) 
             await message.reply_text(f"𝙔𝙤𝙪 𝙝𝙖𝙫𝙚 𝙗𝙚𝙚𝙣 𝙨𝙪𝙘𝙘𝙚𝙨𝙨𝙛𝙪𝙡𝙡𝙮 𝙞𝙣𝙫𝙞𝙩𝙚𝙙 𝙗𝙮 {uss.mention}!") 
             await client.send_message(user_id, text=f"𝙔𝙤𝙪 𝙝𝙖𝙫𝙚 𝙗𝙚𝙚𝙣 𝙨𝙪𝙘𝙘𝙚𝙨𝙨𝙛𝙪𝙡𝙡𝙮 𝙞𝙣𝙫𝙞𝙩𝙚𝙙 𝙗𝙮 {message.from_user.mention}!") 
             await add_premium(client, user_id, uss)
         else:
-            referdb.add_refer_points(user_id, fromuse)
+            await referdb.add_refer_points(user_id, fromuse)
             await message.reply_text(f"𝙔𝙤𝙪 𝙝𝙖𝙫𝙚 𝙗𝙚𝙚𝙣 𝙨𝙪𝙘𝙘𝙚𝙨𝙨𝙛𝙪𝙡𝙡𝙮 𝙞𝙣𝙫𝙞𝙩𝙚𝙙 𝙗𝙮 {uss.mention}!")
             await client.send_message(user_id, f"𝙔𝙤𝙪 𝙝𝙖𝙫𝙚 𝙨𝙪𝙘𝙘𝙚𝙨𝙨𝙛𝙪𝙡𝙡𝙮 𝙞𝙣𝙫𝙞𝙩𝙚𝙙 {message.from_user.mention}!")
         return
@@ -248,24 +251,13 @@ async def start(client:Client, message):
         )
         return
 
+    not_joined = []
     if MULTI_FSUB:
-        not_joined = []
-        for channel_id in MULTI_FSUB:
-            try:
-                member = await client.get_chat_member(channel_id, message.from_user.id)
-                if member.status in ("left", "kicked"):
-                    raise UserNotParticipant
-            except UserNotParticipant:
-                try:
-                    invite_link = await client.create_chat_invite_link(channel_id, creates_join_request=True)
-                    chat = await client.get_chat(channel_id)
-                    not_joined.append((chat.title, invite_link.invite_link))
-                except ChatAdminRequired:
-                    logger.error("Make Sure Bot Is Admin In Forcesub Channel")
-                    return
-            except Exception as e:
-                logger.warning(f"ForceSub Error: {e}")
-                continue
+        try:
+            not_joined = [(title, link) for _, title, link in await fsub_missing(client, message.from_user.id)]
+        except ChatAdminRequired:
+            logger.error("Make Sure Bot Is Admin In Forcesub Channel")
+            return
 
     if not_joined:
         btn = []
@@ -360,9 +352,7 @@ async def start(client:Client, message):
                 reply_markup=reply_markup,
                 parse_mode=enums.ParseMode.HTML
             )
-            await asyncio.sleep(300) 
-            await d.delete()
-            await m.delete()
+            await delete_scheduler.schedule(message.chat.id, [d.id, m.id], 300)
             return
 
     if data and data.startswith("allfiles"):
@@ -398,15 +388,8 @@ async def start(client:Client, message):
         replyed = await message.reply(
             delCap
         )
-        await asyncio.sleep(FILE_AUTO_DEL_TIMER)
-        for file in files_to_delete:
-            try:
-                await file.delete()
-            except:
-                pass
-        return await replyed.edit(
-            afterDelCap,
-        )
+        await delete_scheduler.schedule(message.chat.id, [file.id for file in files_to_delete], FILE_AUTO_DEL_TIMER, replyed.id, afterDelCap)
+        return
     if not data:
         return
 
@@ -436,9 +419,7 @@ async def start(client:Client, message):
     replyed = await message.reply(
         delCap,
         reply_to_message_id= toDel.id)
-    await asyncio.sleep(FILE_AUTO_DEL_TIMER)
-    await toDel.delete()
-    return await replyed.edit(afterDelCap)
+    await delete_scheduler.schedule(message.chat.id, [toDel.id], FILE_AUTO_DEL_TIMER, replyed.id, afterDelCap)
     
 @Client.on_message(filters.command('delete'))
 async def delete(bot, message):
@@ -1089,7 +1070,7 @@ async def top(client, query):
 async def refer(bot, message):
     btn = [[
         InlineKeyboardButton('invite link', url=f'https://telegram.me/share/url?url=https://t.me/{bot.me.username}?start=reff_{message.from_user.id}&text=Hello%21%20Experience%20a%20bot%20that%20offers%20a%20vast%20library%20of%20unlimited%20movies%20and%20series.%20%F0%9F%98%83'),
-        InlineKeyboardButton(f'⏳ {referdb.get_refer_points(message.from_user.id)}', callback_data='ref_point'),
+        InlineKeyboardButton(f'⏳ {await referdb.get_refer_points(message.from_user.id)}', callback_data='ref_point'),
         InlineKeyboardButton('Close', callback_data='close_data')
     ]]  
     m=await message.reply_sticker("CAACAgQAAxkBAAEkt_Rl_7138tgHJdEsqSNzO5mPWioZDgACGRAAAudLcFGAbsHU3KNJUx4E")      
@@ -33,7 +33,6 @@ async def ban_a_user(bot, message):
         if jar['is_banned']:
             return await message.reply(f"{k.mention} is already banned\nReason: {jar['ban_reason']}")
         await db.ban_user(k.id, reason)
-        temp.BANNED_USERS.append(k.id)
         await message.reply(f"Successfully banned {k.mention}")
 
 
@@ -66,6 +65,5 @@ async def unban_a_user(bot, message):
         if not jar['is_banned']:
             return await message.reply(f"{k.mention} is not yet banned.")
         await db.remove_ban(k.id)
-        temp.BANNED_USERS.remove(k.id)
         await message.reply(f"Successfully unbanned {k.mention}")
       
@@ -1,13 +1,26 @@
 from pyrogram import Client, filters, enums
-from pyrogram.types import ChatJoinRequest
+from pyrogram.types import ChatJoinRequest, ChatMemberUpdated
 from database.users_chats_db import db
-from info import ADMINS, AUTH_CHANNEL
+from info import ADMINS, AUTH_CHANNEL, MULTI_FSUB
+from utils import fsub_update
 
 @Client.on_chat_join_request(filters.chat(AUTH_CHANNEL))
 async def join_reqs(client, message: ChatJoinRequest):
   if not await db.find_join_req(message.from_user.id):
     await db.add_join_req(message.from_user.id)
 
+# Group 1 so AUTH_CHANNEL requests still reach join_reqs when it's also in MULTI_FSUB
+@Client.on_chat_join_request(filters.chat(MULTI_FSUB), group=1)
+async def fsub_join_reqs(client, request: ChatJoinRequest):
+    # Not a member yet, forget any cached answer so the next check asks Telegram
+    fsub_update(request.chat.id, request.from_user.id)
+
+@Client.on_chat_member_updated(filters.chat(MULTI_FSUB), group=1)
+async def fsub_member_update(client, update: ChatMemberUpdated):
+    member = update.new_chat_member or update.old_chat_member
+    joined = update.new_chat_member is not None and update.new_chat_member.status not in (enums.ChatMemberStatus.LEFT, enums.ChatMemberStatus.BANNED)
+    fsub_update(update.chat.id, member.user.id, joined)
+
 @Client.on_message(filters.command("delreq") & filters.private & filters.user(ADMINS))
 async def del_requests(client, message):
     await db.del_join_req()    
@@ -15,13 +15,15 @@ import random
 lock = asyncio.Lock()
 import traceback
 from fuzzywuzzy import process
-BUTTONS = {}
+from Spidey.util.ttl_cache import TTLCache
+BUTTONS = TTLCache("buttons", maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TIME)
 FILES_ID = {}
-CAP = {}
+CAP = TTLCache("captions", maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TIME)
 
 # Spidey [
 from database.Spideyreferdb import referdb
 from database.config_db import mdb
+from database.delete_scheduler import delete_scheduler
 import logging
 from urllib.parse import quote_plus
 from Spidey.util.file_properties import get_name, get_hash, get_media_file_size
@@ -124,7 +126,7 @@ async def group_search(client, message):
 async def refercall(bot, query):
     btn = [[
         InlineKeyboardButton('Iɴᴠɪᴛᴇ Lɪɴᴋ', url=f'https://telegram.me/share/url?url=https://t.me/{bot.me.username}?start=reff_{query.from_user.id}&text=Hello%21%20Experience%20a%20bot%20that%20offers%20a%20vast%20library%20of%20unlimited%20movies%20and%20series.%20%F0%9F%98%83'),
-        InlineKeyboardButton(f'⏳ {referdb.get_refer_points(query.from_user.id)}', callback_data='ref_point'),
+        InlineKeyboardButton(f'⏳ {await referdb.get_refer_points(query.from_user.id)}', callback_data='ref_point'),
         InlineKeyboardButton('Bᴀᴄᴋ', callback_data='close_data')
     ]]
     reply_markup = InlineKeyboardMarkup(btn)
@@ -160,9 +162,9 @@ async def next_page(bot, query):
         n_offset = 0
     if not files:
         return
-    temp.FILES_ID[key] = files
+    temp.FILES_ID[key] = compact_files(files)
     batch_ids = files
-    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = batch_ids
+    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = compact_files(batch_ids)
     batch_link = f"batchfiles#{query.message.chat.id}#{query.id}#{query.from_user.id}"
     ads, ads_name, _ = await mdb.get_advirtisment()
     ads_text = ""
@@ -177,10 +179,9 @@ async def next_page(bot, query):
     links = ""
     if settings["link"]:
         btn = []
-        for file_num, file in enumerate(files, start=offset+1):
-            links += f"""<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
+        links = file_links(files, offset+1, f"file_{query.message.chat.id}_")
     else:
-        btn = [[InlineKeyboardButton(text=f"📁 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}", url=f'https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}'),]
+        btn = [[InlineKeyboardButton(text=f"📁 {file_label(file, False)}", url=f'https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}'),]
                 for file in files
               ]
     btn.insert(0,[
@@ -217,9 +218,6 @@ async def next_page(bot, query):
             ],
         )
     if settings["link"]:
-        links = ""
-        for file_num, file in enumerate(files, start=offset+1):
-            links += f"""<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
         await query.message.edit_text(cap + links + js_ads, disable_web_page_preview=True, parse_mode=enums.ParseMode.HTML, reply_markup=InlineKeyboardMarkup(btn))
         return        
     try:
@@ -293,7 +291,7 @@ async def season_search(client: Client, query: CallbackQuery):
             return
 
     batch_ids = files
-    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = batch_ids
+    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = compact_files(batch_ids)
     batch_link = f"batchfiles#{query.message.chat.id}#{query.id}#{query.from_user.id}"
     reqnxt = query.from_user.id if query.from_user else 0
     settings = await get_settings(query.message.chat.id)
@@ -308,11 +306,10 @@ async def season_search(client: Client, query: CallbackQuery):
     links = ""
     if settings["link"]:
         btn = []
-        for file_num, file in enumerate(files, start=offset+1):
-            links += f"""<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
+        links = file_links(files, offset+1, f"file_{query.message.chat.id}_")
     else:
         btn = [[
-                InlineKeyboardButton(text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
+                InlineKeyboardButton(text=f"🔗 {file_label(file, False)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
                    for file in files
               ]
    
@@ -398,7 +395,7 @@ async def year_search(client: Client, query: CallbackQuery):
         return
 
     batch_ids = files
-    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = batch_ids
+    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = compact_files(batch_ids)
     batch_link = f"batchfiles#{query.message.chat.id}#{query.id}#{query.from_user.id}"
 
     reqnxt = query.from_user.id if query.from_user else 0
@@ -414,11 +411,10 @@ async def year_search(client: Client, query: CallbackQuery):
     links = ""
     if settings["link"]:
         btn = []
-        for file_num, file in enumerate(files, start=offset+1):
-            links += f"""<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
+        links = file_links(files, offset+1, f"file_{query.message.chat.id}_")
     else:
         btn = [[
-                InlineKeyboardButton(text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
+                InlineKeyboardButton(text=f"🔗 {file_label(file, False)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
                    for file in files
               ]
         
@@ -504,7 +500,7 @@ async def quality_search(client: Client, query: CallbackQuery):
         return
 
     batch_ids = files
-    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = batch_ids
+    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = compact_files(batch_ids)
     batch_link = f"batchfiles#{query.message.chat.id}#{query.id}#{query.from_user.id}"
 
     reqnxt = query.from_user.id if query.from_user else 0
@@ -520,11 +516,10 @@ async def quality_search(client: Client, query: CallbackQuery):
     links = ""
     if settings["link"]:
         btn = []
-        for file_num, file in enumerate(files, start=offset+1):
-            links += f"""<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
+        links = file_links(files, offset+1, f"file_{query.message.chat.id}_")
     else:
         btn = [[
-                InlineKeyboardButton(text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
+                InlineKeyboardButton(text=f"🔗 {file_label(file, False)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
                    for file in files
               ]
         
@@ -613,7 +608,7 @@ async def lang_search(client: Client, query: CallbackQuery):
             return await query.answer(f"sᴏʀʀʏ ʟᴀɴɢᴜᴀɢᴇ {lang.title()} ɴᴏᴛ ғᴏᴜɴᴅ ғᴏʀ {search}", show_alert=1)
 
     batch_ids = files
-    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = batch_ids
+    temp.FILES_ID[f"{query.message.chat.id}-{query.id}"] = compact_files(batch_ids)
     batch_link = f"batchfiles#{query.message.chat.id}#{query.id}#{query.from_user.id}"
 
     reqnxt = query.from_user.id if query.from_user else 0
@@ -631,11 +626,10 @@ async def lang_search(client: Client, query: CallbackQuery):
     links = ""
     if settings["link"]:
         btn = []
-        for file_num, file in enumerate(files, start=offset+1):
-            links += f"""<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
+        links = file_links(files, offset+1, f"file_{query.message.chat.id}_")
     else:
         btn = [[
-                InlineKeyboardButton(text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
+                InlineKeyboardButton(text=f"🔗 {file_label(file, False)}", callback_data=f'cfiles#{reqnxt}#{file.file_id}'),]
                    for file in files
               ]
         
@@ -775,24 +769,14 @@ async def cb_handler(client: Client, query: CallbackQuery):
         ident, file_id, grp_id = query.data.split("#")
         chat_id = grp_id if grp_id not in ['None', ''] else query.message.chat.id
 
-        not_joined = []
         btn = []
-
-        for channel_id in MULTI_FSUB:
-            try:
-                member = await client.get_chat_member(channel_id, query.from_user.id)
-                if member.status in ("left", "kicked"):
-                    raise UserNotParticipant
-            except UserNotParticipant:
-                try:
-                    chat = await client.get_chat(channel_id)
-                    invite_link = await client.create_chat_invite_link(channel_id, creates_join_request=True)
-                    btn.append([InlineKeyboardButton(f"🎗️ Join {chat.title}", url=invite_link.invite_link)])
-                    not_joined.append(channel_id)
-                except Exception as e:
-                    logger.warning(f"Invite link error for {channel_id}: {e}")
-            except Exception as e:
-                logger.warning(f"CheckSub error: {e}")
+        try:
+            missing = await fsub_missing(client, query.from_user.id)
+        except Exception as e:
+            logger.warning(f"Invite link error: {e}")
+            missing = []
+        for channel_id, title, link in missing:
+            btn.append([InlineKeyboardButton(f"🎗️ Join {title}", url=link)])
 
         if btn:
             btn.append([InlineKeyboardButton("♻️ ᴛʀʏ ᴀɢᴀɪɴ ♻️", callback_data=f"checksub#{file_id}#{chat_id}")])
@@ -1275,7 +1259,7 @@ async def cb_handler(client: Client, query: CallbackQuery):
             )
             
     elif query.data == "ref_point":
-        await query.answer(f'You Have: {referdb.get_refer_points(query.from_user.id)} Refferal points.', show_alert=True)
+        await query.answer(f'You Have: {await referdb.get_refer_points(query.from_user.id)} Refferal points.', show_alert=True)
 
     elif query.data == "verifyon":
         await query.answer(f'Only the bot admin can ᴏɴ ✓ or ᴏғғ ✗ this feature.', show_alert=True)
@@ -1844,7 +1828,7 @@ async def cb_handler(client: Client, query: CallbackQuery):
 	    
 async def ai_spell_check(wrong_name):
     async def search_movie(wrong_name):
-        search_results = imdb.search_movie(wrong_name)
+        search_results = await search_imdb(wrong_name)
         movie_list = [movie['title'] for movie in search_results]
         return movie_list
     movie_list = await search_movie(wrong_name)
@@ -1889,7 +1873,7 @@ async def auto_filter(client, msg, spoll=False , pm_mode = False):
     req = message.from_user.id if message.from_user else 0
     key = f"{message.chat.id}-{message.id}"
     batch_ids = files
-    temp.FILES_ID[f"{message.chat.id}-{message.id}"] = batch_ids
+    temp.FILES_ID[f"{message.chat.id}-{message.id}"] = compact_files(batch_ids)
     batch_link = f"batchfiles#{message.chat.id}#{message.id}#{message.from_user.id}"
     temp.CHAT[message.from_user.id] = message.chat.id
     settings = await get_settings(message.chat.id , pm_mode=pm_mode)
@@ -1897,10 +1881,9 @@ async def auto_filter(client, msg, spoll=False , pm_mode = False):
     links = ""
     if settings["link"]:
         btn = []
-        for file_num, file in enumerate(files, start=1):
-            links += f"""<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start={"pm_mode_" if pm_mode else ''}file_{ADMINS[0] if pm_mode else message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {formate_file_name(file.file_name)}</a></b>"""
+        links = file_links(files, 1, f"{'pm_mode_' if pm_mode else ''}file_{ADMINS[0] if pm_mode else message.chat.id}_")
     else:
-        btn = [[InlineKeyboardButton(text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}", url=f'https://telegram.dog/{temp.U_NAME}?start=file_{message.chat.id}_{file.file_id}'),]
+        btn = [[InlineKeyboardButton(text=f"🔗 {file_label(file, False)}", url=f'https://telegram.dog/{temp.U_NAME}?start=file_{message.chat.id}_{file.file_id}'),]
                for file in files
               ]
     if offset != "":
@@ -2000,12 +1983,7 @@ async def auto_filter(client, msg, spoll=False , pm_mode = False):
             if settings['auto_delete']:
                 k = await message.reply_photo(photo=imdb.get('poster'), caption=cap[:1024] + links + del_msg, parse_mode=enums.ParseMode.HTML, reply_markup=InlineKeyboardMarkup(btn))
               #  await delSticker(st)
-                await asyncio.sleep(DELETE_TIME)
-                await k.delete()
-                try:
-                    await message.delete()
-                except:
-                    pass
+                await delete_scheduler.schedule(message.chat.id, [k.id, message.id], DELETE_TIME)
             else:
                 await message.reply_photo(photo=imdb.get('poster'), caption=cap[:1024] + links + js_ads, reply_markup=InlineKeyboardMarkup(btn))                    
         except (MediaEmpty, PhotoInvalidDimensions, WebpageMediaEmpty):
@@ -2014,12 +1992,7 @@ async def auto_filter(client, msg, spoll=False , pm_mode = False):
             if settings["auto_delete"]:
                 k = await message.reply_photo(photo=poster, caption=cap[:1024] + links + js_ads, parse_mode=enums.ParseMode.HTML, reply_markup=InlineKeyboardMarkup(btn))
                 #await delSticker(st)
-                await asyncio.sleep(DELETE_TIME)
-                await k.delete()
-                try:
-                    await message.delete()
-                except:
-                    pass
+                await delete_scheduler.schedule(message.chat.id, [k.id, message.id], DELETE_TIME)
             else:
                 await message.reply_photo(photo=poster, caption=cap[:1024] + links + js_ads, parse_mode=enums.ParseMode.HTML, reply_markup=InlineKeyboardMarkup(btn))
         except Exception as e:
@@ -2028,14 +2001,9 @@ async def auto_filter(client, msg, spoll=False , pm_mode = False):
                 #await delSticker(st)
                 try:
                     k = await message.reply_text(cap + links + js_ads, parse_mode=enums.ParseMode.HTML, reply_markup=InlineKeyboardMarkup(btn), disable_web_page_preview=True)
+                    await delete_scheduler.schedule(message.chat.id, [k.id, message.id], DELETE_TIME)
                 except Exception as e:
                     print("error", e)
-                await asyncio.sleep(DELETE_TIME)
-                await k.delete()
-                try:
-                    await message.delete()
-                except:
-                    pass
             else:
                 await message.reply_text(cap + links + js_ads, parse_mode=enums.ParseMode.HTML, reply_markup=InlineKeyboardMarkup(btn), disable_web_page_preview=True)
     else:
@@ -2043,12 +2011,7 @@ async def auto_filter(client, msg, spoll=False , pm_mode = False):
        # await delSticker(st)
         if settings['auto_delete']:
           #  await delSticker(st)
-            await asyncio.sleep(DELETE_TIME)
-            await k.delete()
-            try:
-                await message.delete()
-            except:
-                pass
+            await delete_scheduler.schedule(message.chat.id, [k.id, message.id], DELETE_TIME)
     return            
 async def advantage_spell_chok(message):
     mv_id = message.id
@@ -9,7 +9,10 @@ from aiohttp.http_exceptions import BadStatusLine
 from Spidey.bot import multi_clients, work_loads, SpideyBot
 from Spidey.server.exceptions import FIleNotFound, InvalidHash
 from Spidey import StartTime, __version__
-from Spidey.util.custom_dl import ByteStreamer
+from Spidey.util.custom_dl import ByteStreamer, get_cached_head
+from Spidey.util.traffic import traffic
+from Spidey.util.ttl_cache import caches
+from Spidey.util.byte_range import RangeNotSatisfiable, parse_range_header, plan_parts
 from Spidey.util.time_format import get_readable_time
 from Spidey.util.render_template import render_page
 from info import *
@@ -21,6 +24,17 @@ routes = web.RouteTableDef()
 async def root_route_handler(request):
     return web.json_response("Filter Bot")
 
+@routes.get("/stats", allow_head=True)
+async def stats_route_handler(request):
+    token = request.rel_url.query.get("token", "")
+    detail = bool(STATS_TOKEN) and secrets.compare_digest(token, STATS_TOKEN)
+    stats = traffic.snapshot(detail)
+    stats["work_loads"] = {str(index): load for index, load in work_loads.items()}
+    if detail:
+        stats["caches"] = {name: cache.stats() for name, cache in caches.items()}
+    stats["uptime"] = get_readable_time(time.time() - StartTime)
+    return web.json_response(stats)
+
 @routes.get(r"/watch/{path:\S+}", allow_head=True)
 async def stream_handler(request: web.Request):
     try:
@@ -55,6 +69,8 @@ async def stream_handler(request: web.Request):
             id = int(re.search(r"(\d+)(?:\/\S+)?", path).group(1))
             secure_hash = request.rel_url.query.get("hash")
         return await media_streamer(request, id, secure_hash)
+    except web.HTTPException:
+        raise
     except InvalidHash as e:
         raise web.HTTPForbidden(text=e.message)
     except FIleNotFound as e:
@@ -67,25 +83,99 @@ async def stream_handler(request: web.Request):
 
 class_cache = {}
 
+def get_remote(request: web.Request) -> str:
+    """The client IP, X-Forwarded-For only counts when a trusted proxy sent it."""
+    remote = request.remote
+    forwarded = request.headers.get("X-Forwarded-For")
+    if not forwarded or remote not in TRUSTED_PROXIES:
+        return remote
+    # Walk back through the proxies we trust, the first hop we don't is the client
+    for hop in reversed([hop.strip() for hop in forwarded.split(",")]):
+        if hop and hop not in TRUSTED_PROXIES:
+            return hop
+    return remote
+
+def get_streamer(index: int) -> ByteStreamer:
+    faster_client = multi_clients[index]
+    if faster_client in class_cache:
+        logging.debug(f"Using cached ByteStreamer object for client {index}")
+        return class_cache[faster_client]
+    logging.debug(f"Creating new ByteStreamer object for client {index}")
+    tg_connect = ByteStreamer(faster_client)
+    class_cache[faster_client] = tg_connect
+    return tg_connect
+
+def get_cached_properties(id: int):
+    """Returns the file properties any client already has for the message, without Telegram traffic."""
+    for tg_connect in class_cache.values():
+        file_id = tg_connect.cached_file_ids.get(id)
+        if file_id is not None:
+            return file_id
+    return None
+
+def get_headers(file_id) -> dict:
+    mime_type = file_id.mime_type
+    file_name = file_id.file_name
+    disposition = "attachment"
+
+    if mime_type:
+        if not file_name:
+            try:
+                file_name = f"{secrets.token_hex(2)}.{mime_type.split('/')[1]}"
+            except (IndexError, AttributeError):
+                file_name = f"{secrets.token_hex(2)}.unknown"
+    else:
+        if file_name:
+            mime_type = mimetypes.guess_type(file_id.file_name)[0] or "application/octet-stream"
+        else:
+            mime_type = "application/octet-stream"
+            file_name = f"{secrets.token_hex(2)}.unknown"
+
+    return {
+        "Content-Type": f"{mime_type}",
+        "Content-Disposition": f'{disposition}; filename="{file_name}"',
+        "Accept-Ranges": "bytes",
+    }
+
+def get_multipart_heads(ranges, content_type: str, file_size: int, boundary: str):
+    """Returns the part headers of a multipart/byteranges body and the closing delimiter."""
+    heads = [
+        (
+            f"--{boundary}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Range: bytes {from_bytes}-{until_bytes}/{file_size}\r\n\r\n"
+        ).encode()
+        for from_bytes, until_bytes in ranges
+    ]
+    # Every part after the first starts on a new line
+    heads = [heads[0]] + [b"\r\n" + head for head in heads[1:]]
+    return heads, f"\r\n--{boundary}--\r\n".encode()
+
+async def yield_multipart(tg_connect, file_id, index, ranges, heads, tail, remote, id):
+    for (from_bytes, until_bytes), head in zip(ranges, heads):
+        yield head
+        async for chunk in tg_connect.yield_file(
+            file_id, index, *plan_parts(from_bytes, until_bytes), remote, id
+        ):
+            yield chunk
+    yield tail
+
 async def media_streamer(request: web.Request, id: int, secure_hash: str):
-    range_header = request.headers.get("Range", 0)
-    
+    range_header = request.headers.get("Range", "")
+    remote = get_remote(request)
+
     index = min(work_loads, key=work_loads.get)
-    faster_client = multi_clients[index]
     
     if MULTI_CLIENT:
         logging.info(f"Client {index} is now serving {request.remote}")
 
-    if faster_client in class_cache:
-        tg_connect = class_cache[faster_client]
-        logging.debug(f"Using cached ByteStreamer object for client {index}")
-    else:
-        logging.debug(f"Creating new ByteStreamer object for client {index}")
-        tg_connect = ByteStreamer(faster_client)
-        class_cache[faster_client] = tg_connect
-    logging.debug("before calling get_file_properties")
-    file_id = await tg_connect.get_file_properties(id)
-    logging.debug("after calling get_file_properties")
+    tg_connect = get_streamer(index)
+    # HEAD requests and probes only need metadata, any client's cache will do
+    file_id = get_cached_properties(id)
+    if file_id is None:
+        logging.debug("before calling get_file_properties")
+        file_id = await tg_connect.get_file_properties(id)
+        logging.debug("after calling get_file_properties")
     
     if file_id.unique_id[:6] != secure_hash:
         logging.debug(f"Invalid hash for message with ID {id}")
@@ -93,59 +183,72 @@ async def media_streamer(request: web.Request, id: int, secure_hash: str):
     
     file_size = file_id.file_size
 
-    if range_header:
-        from_bytes, until_bytes = range_header.replace("bytes=", "").split("-")
-        from_bytes = int(from_bytes)
-        until_bytes = int(until_bytes) if until_bytes else file_size - 1
-    else:
-        from_bytes = request.http_range.start or 0
-        until_bytes = (request.http_range.stop or file_size) - 1
-
-    if (until_bytes > file_size) or (from_bytes < 0) or (until_bytes < from_bytes):
+    try:
+        ranges = parse_range_header(range_header, file_size) if range_header else None
+    except RangeNotSatisfiable:
         return web.Response(
             status=416,
             body="416: Range not satisfiable",
             headers={"Content-Range": f"bytes */{file_size}"},
         )
 
-    chunk_size = 1024 * 1024
-    until_bytes = min(until_bytes, file_size - 1)
+    headers = get_headers(file_id)
+    if ranges is None:
+        status = 200
+        ranges = [(0, file_size - 1)]
+        headers["Content-Length"] = str(file_size)
+    elif len(ranges) == 1:
+        status = 206
+        from_bytes, until_bytes = ranges[0]
+        headers["Content-Range"] = f"bytes {from_bytes}-{until_bytes}/{file_size}"
+        headers["Content-Length"] = str(until_bytes - from_bytes + 1)
+    else:
+        status = 206
+        boundary = secrets.token_hex(16)
+        heads, tail = get_multipart_heads(ranges, headers["Content-Type"], file_size, boundary)
+        headers["Content-Type"] = f"multipart/byteranges; boundary={boundary}"
+        headers["Content-Length"] = str(
+            sum(len(head) for head in heads) + len(tail)
+            + sum(until_bytes - from_bytes + 1 for from_bytes, until_bytes in ranges)
+        )
 
-    offset = from_bytes - (from_bytes % chunk_size)
-    first_part_cut = from_bytes - offset
-    last_part_cut = until_bytes % chunk_size + 1
+    if request.method == "HEAD" or not file_size:
+        return web.Response(status=status, headers=headers)
 
-    req_length = until_bytes - from_bytes + 1
-    part_count = math.ceil(until_bytes / chunk_size) - math.floor(offset / chunk_size)
-    body = tg_connect.yield_file(
-        file_id, index, offset, first_part_cut, last_part_cut, part_count, chunk_size
-    )
+    if len(ranges) == 1:
+        from_bytes, until_bytes = ranges[0]
+        head = get_cached_head(id, until_bytes)
+        if head is not None:
+            logging.debug(f"Answered bytes {from_bytes}-{until_bytes} of {id} from the probe cache")
+            return web.Response(status=status, body=head[from_bytes:until_bytes + 1], headers=headers)
 
-    mime_type = file_id.mime_type
-    file_name = file_id.file_name
-    disposition = "attachment"
+    if not traffic.try_open(remote):
+        raise web.HTTPTooManyRequests(text="429: Too many parallel streams")
 
-    if mime_type:
-        if not file_name:
-            try:
-                file_name = f"{secrets.token_hex(2)}.{mime_type.split('/')[1]}"
-            except (IndexError, AttributeError):
-                file_name = f"{secrets.token_hex(2)}.unknown"
-    else:
-        if file_name:
-            mime_type = mimetypes.guess_type(file_id.file_name)
-        else:
-            mime_type = "application/octet-stream"
-            file_name = f"{secrets.token_hex(2)}.unknown"
+    body = None
+    try:
+        # Downloads need this client's own file reference
+        file_id = await tg_connect.get_file_properties(id)
 
-    return web.Response(
-        status=206 if range_header else 200,
-        body=body,
-        headers={
-            "Content-Type": f"{mime_type}",
-            "Content-Range": f"bytes {from_bytes}-{until_bytes}/{file_size}",
-            "Content-Length": str(req_length),
-            "Content-Disposition": f'{disposition}; filename="{file_name}"',
-            "Accept-Ranges": "bytes",
-        },
-    )
+        if len(ranges) == 1:
+            body = tg_connect.yield_file(
+                file_id, index, *plan_parts(from_bytes, until_bytes), remote, id
+            )
+        else:
+            body = yield_multipart(tg_connect, file_id, index, ranges, heads, tail, remote, id)
+
+        # Streamed here rather than handed to aiohttp, so the slot is given back however it ends
+        response = web.StreamResponse(status=status, headers=headers)
+        await response.prepare(request)
+        try:
+            async for chunk in body:
+                await response.write(chunk)
+            await response.write_eof()
+        except ConnectionResetError:
+            # The response is already on the wire, it has to be returned even when the client left
+            logging.debug(f"{remote} went away while streaming {id}")
+        return response
+    finally:
+        if body is not None:
+            await body.aclose()
+        traffic.closed(remote)
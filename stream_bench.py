@@ -0,0 +1,194 @@
+"""
+stream_bench.py - Offline benchmark for the stream link route
+
+Drives plugins/route.media_streamer through aiohttp's test client while a
+fake media session answers upload.GetFile with in-memory bytes after a
+configurable latency. Nothing talks to Telegram or MongoDB.
+
+Scenarios:
+  - sequential: whole file downloads, one after another
+  - seeks: random ranged reads, like a player scrubbing
+  - viewers: N concurrent viewers reading the whole file
+
+Each scenario reports throughput, time to first byte and peak Python heap.
+
+Usage:
+  python3 stream_bench.py --size 64 --latency 80 --viewers 8 --seeks 50
+"""
+
+import os
+
+# The stream route pulls in the database modules; keep them off the network
+# and lift the per-IP cap since every viewer here comes from 127.0.0.1.
+for key in ("DATABASE_URI", "DATABASE_URI_1", "DATABASE_URI_2", "DATABASE_URI_3", "DATABASE_URI_4", "DATABASE_URI_5"):
+    os.environ.setdefault(key, "mongodb://127.0.0.1:27017")
+os.environ.setdefault("STREAM_MAX_CONNECTIONS_PER_IP", "0")
+
+import time
+import random
+import asyncio
+import argparse
+import statistics
+import tracemalloc
+from typing import List, Tuple
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from pyrogram import raw
+from pyrogram.file_id import FileType
+
+from Spidey.bot import multi_clients, work_loads
+from Spidey.util import custom_dl
+from Spidey.util.custom_dl import ByteStreamer
+from plugins import route
+
+MESSAGE_ID = 777
+UNIQUE_ID = "AgADbench0000"
+
+
+class FakeFileId:
+    """Just the FileId attributes the stream route and get_location read."""
+
+    def __init__(self, file_size: int):
+        self.file_type = FileType.DOCUMENT
+        self.dc_id = 1
+        self.media_id = 1
+        self.access_hash = 1
+        self.file_reference = b""
+        self.thumbnail_size = ""
+        self.file_size = file_size
+        self.mime_type = "video/mp4"
+        self.file_name = "bench.mp4"
+        self.unique_id = UNIQUE_ID
+
+
+class FakeSession:
+    def __init__(self, data: bytes, latency: float, bandwidth: float):
+        """A media session whose send() returns upload.File chunks of `data`.
+        attributes:
+            latency: seconds added to every request.
+            bandwidth: bytes per second of the simulated DC link, 0 for unlimited.
+            requests: the number of GetFile calls served.
+        """
+        self.data = data
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.requests = 0
+        self.requested_bytes = 0
+
+    async def send(self, query):
+        offset, limit = query.offset, query.limit
+        # Same rules Telegram enforces for upload.GetFile
+        assert offset % 4096 == 0 and limit % 4096 == 0, (offset, limit)
+        assert (1024 * 1024) % limit == 0, limit
+        assert offset // (1024 * 1024) == (offset + limit - 1) // (1024 * 1024), (offset, limit)
+        chunk = self.data[offset:offset + limit]
+        self.requests += 1
+        self.requested_bytes += len(chunk)
+        delay = self.latency + (len(chunk) / self.bandwidth if self.bandwidth else 0)
+        await asyncio.sleep(delay)
+        return raw.types.upload.File(type=raw.types.storage.FilePartial(), mtime=0, bytes=chunk)
+
+
+class BenchStreamer(ByteStreamer):
+    def __init__(self, client, session: FakeSession, file_size: int):
+        super().__init__(client)
+        self.session = session
+        self.cached_file_ids[MESSAGE_ID] = FakeFileId(file_size)
+
+    async def generate_file_properties(self, id: int):
+        self.cached_file_ids[id] = FakeFileId(len(self.session.data))
+        return self.cached_file_ids[id]
+
+    async def generate_media_session(self, client, file_id):
+        return self.session
+
+
+async def fetch(client: TestClient, headers=None) -> Tuple[float, float, int]:
+    """Returns (time to first byte, total time, bytes read) for one request."""
+    start = time.perf_counter()
+    ttfb = None
+    size = 0
+    async with client.get(f"/{MESSAGE_ID}/bench.mp4?hash={UNIQUE_ID[:6]}", headers=headers) as resp:
+        assert resp.status in (200, 206), resp.status
+        async for chunk in resp.content.iter_any():
+            if ttfb is None:
+                ttfb = time.perf_counter() - start
+            size += len(chunk)
+    return ttfb or 0.0, time.perf_counter() - start, size
+
+
+def report(name: str, results: List[Tuple[float, float, int]], elapsed: float, peak: int, session: FakeSession):
+    ttfbs = [r[0] for r in results]
+    total = sum(r[2] for r in results)
+    print(f"\n== {name} ==")
+    print(f"requests      : {len(results)}")
+    print(f"bytes served  : {total / 1024 / 1024:.2f} MiB in {elapsed:.2f}s")
+    print(f"throughput    : {total / 1024 / 1024 / elapsed:.2f} MiB/s")
+    print(f"ttfb          : median {statistics.median(ttfbs) * 1000:.1f} ms, max {max(ttfbs) * 1000:.1f} ms")
+    print(f"GetFile calls : {session.requests} ({session.requested_bytes / 1024 / 1024:.2f} MiB fetched)")
+    print(f"peak heap     : {peak / 1024 / 1024:.2f} MiB")
+
+
+async def scenario(name, session, coros):
+    session.requests = session.requested_bytes = 0
+    custom_dl.cached_heads.clear()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    results = await coros()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    report(name, results, elapsed, peak, session)
+
+
+async def main(args):
+    file_size = args.size * 1024 * 1024
+    data = random.Random(0).randbytes(file_size)
+    session = FakeSession(data, args.latency / 1000, args.bandwidth * 1024 * 1024)
+
+    fake_client = object()
+    multi_clients.clear()
+    work_loads.clear()
+    multi_clients[0] = fake_client
+    work_loads[0] = 0
+    route.class_cache[fake_client] = BenchStreamer(fake_client, session, file_size)
+
+    app = web.Application()
+    app.add_routes(route.routes)
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    tracemalloc.start()
+    try:
+        async def sequential():
+            return [await fetch(client) for _ in range(args.downloads)]
+
+        async def seeks():
+            results = []
+            rng = random.Random(1)
+            for _ in range(args.seeks):
+                start = rng.randrange(file_size)
+                until = min(file_size - 1, start + args.seek_size * 1024 - 1)
+                results.append(await fetch(client, {"Range": f"bytes={start}-{until}"}))
+            return results
+
+        async def viewers():
+            return await asyncio.gather(*[fetch(client) for _ in range(args.viewers)])
+
+        await scenario("sequential", session, sequential)
+        await scenario(f"random seeks ({args.seek_size} KiB)", session, seeks)
+        await scenario(f"{args.viewers} concurrent viewers", session, viewers)
+    finally:
+        tracemalloc.stop()
+        await client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the stream route against a fake Telegram media session.")
+    parser.add_argument("--size", type=int, default=32, help="file size in MiB")
+    parser.add_argument("--latency", type=float, default=50, help="GetFile latency in ms")
+    parser.add_argument("--bandwidth", type=float, default=0, help="simulated DC bandwidth in MiB/s, 0 for unlimited")
+    parser.add_argument("--downloads", type=int, default=2, help="sequential whole file downloads")
+    parser.add_argument("--seeks", type=int, default=30, help="random ranged reads")
+    parser.add_argument("--seek-size", type=int, default=256, help="bytes per ranged read in KiB")
+    parser.add_argument("--viewers", type=int, default=8, help="concurrent viewers")
+    asyncio.run(main(parser.parse_args()))
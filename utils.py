@@ -1,8 +1,11 @@
 import logging
-from pyrogram.errors import InputUserDeactivated, UserNotParticipant, FloodWait, UserIsBlocked, PeerIdInvalid
-from info import AUTH_CHANNEL, LONG_IMDB_DESCRIPTION, IS_VERIFY , SETTINGS , START_IMG
+from pyrogram.errors import InputUserDeactivated, UserNotParticipant, FloodWait, UserIsBlocked, PeerIdInvalid, ChannelPrivate, ChannelInvalid, ChatIdInvalid
+from info import AUTH_CHANNEL, LONG_IMDB_DESCRIPTION, IS_VERIFY , SETTINGS , START_IMG, SETTINGS_CACHE_TIME, IMDB_WORKERS, IMDB_CACHE_TIME, IMDB_NEGATIVE_CACHE_TIME, SEARCH_CACHE_SIZE, SEARCH_CACHE_TIME, SEARCH_CACHE_BYTES, FILE_LABEL_CACHE_SIZE, FILE_LABEL_CACHE_TIME, MULTI_FSUB, FSUB_CACHE_SIZE, FSUB_CACHE_TIME, FSUB_NEGATIVE_CACHE_TIME
 from imdb import Cinemagoer
 import asyncio
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pyrogram.types import Message
 from pyrogram import enums
 import pytz, re, os 
@@ -10,6 +13,8 @@ from shortzy import Shortzy
 from datetime import datetime
 from typing import Any
 from database.users_chats_db import db
+from database.ia_filterdb import MediaRecord
+from Spidey.util.ttl_cache import TTLCache
 
 
 logger = logging.getLogger(__name__)
@@ -17,6 +22,11 @@ logger.setLevel(logging.INFO)
 
 BANNED = {}
 imdb = Cinemagoer() 
+imdb_pool = ThreadPoolExecutor(max_workers=IMDB_WORKERS, thread_name_prefix="imdb")
+# Memory layer in front of the MongoDB IMDb cache, key -> (expires_at, data)
+imdb_memory = OrderedDict()
+imdb_pending = {}
+MAX_IMDB_MEMORY = 512
  
 class temp(object):
     ME = None
@@ -26,16 +36,44 @@ class temp(object):
     B_NAME = None
     B_LINK = None
     SETTINGS = {}
-    FILES_ID = {}
+    # Search results per message, read back by the send all / allfiles paths
+    FILES_ID = TTLCache("files_id", maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TIME, max_bytes=SEARCH_CACHE_BYTES)
     MELCOW = {}
-    USERS_CANCEL = False
-    GROUPS_CANCEL = False    
-    CHAT = {}
-    BANNED_USERS = []
-    BANNED_CHATS = []
+    # user id -> the group they last searched in
+    CHAT = TTLCache("chat", maxsize=SEARCH_CACHE_SIZE * 4, ttl=SEARCH_CACHE_TIME * 4)
+    # The sets db keeps current on every ban / disable
+    BANNED_USERS = db.banned_users
+    BANNED_CHATS = db.disabled_chats
+CachedFile = namedtuple("CachedFile", ("file_id", "file_name", "file_size", "caption"))
+
+def compact_files(files):
+    """Keeps only what delivery reads from search results, not whole Media documents."""
+    return tuple(
+        file if isinstance(file, (MediaRecord, CachedFile)) else CachedFile(file.file_id, file.file_name, file.file_size, file.caption)
+        for file in files
+    )
+
 def formate_file_name(file_name):
     file_name = ' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file_name.split()))
     return file_name
+
+# Result labels per (file id, link mode), shared by every page and chat showing the file
+file_labels = TTLCache("file_labels", maxsize=FILE_LABEL_CACHE_SIZE, ttl=FILE_LABEL_CACHE_TIME)
+
+def file_label(file, link_mode):
+    key = (file.file_id, link_mode)
+    label = file_labels.get(key)
+    if label is None:
+        size, name = get_size(file.file_size), formate_file_name(file.file_name)
+        label = file_labels[key] = f"[{size}] {name}" if link_mode else f"{size}≽ {name}"
+    return label
+
+def file_links(files, start, start_param):
+    """The numbered HTML list shown when settings["link"] is on, start_param prefixes the file id in the /start link."""
+    return "".join(
+        f"<b>\n\n{file_num}. <a href=https://t.me/{temp.U_NAME}?start={start_param}{file.file_id}>{file_label(file, True)}</a></b>"
+        for file_num, file in enumerate(files, start=start)
+    )
     
 async def is_req_subscribed(bot, query):
     if await db.find_join_req(query.from_user.id):
@@ -52,6 +90,64 @@ async def is_req_subscribed(bot, query):
 
     return False
 
+# MULTI_FSUB membership by (channel id, user id), kept current by the handlers in join_req.py
+fsub_members = TTLCache("fsub_members", maxsize=FSUB_CACHE_SIZE, ttl=FSUB_CACHE_TIME)
+# Users seen outside a channel, short lived in case their join update was missed
+fsub_outside = TTLCache("fsub_outside", maxsize=FSUB_CACHE_SIZE, ttl=FSUB_NEGATIVE_CACHE_TIME)
+# channel id -> (title, invite link), made once instead of a new link per check
+fsub_invites = {}
+fsub_invite_lock = asyncio.Lock()
+
+def fsub_update(channel_id, user_id, joined=None):
+    """Records a membership change, None forgets the user so the next check asks Telegram."""
+    key = (int(channel_id), int(user_id))
+    fsub_members.pop(key)
+    fsub_outside.pop(key)
+    if joined:
+        fsub_members[key] = True
+    elif joined is False:
+        fsub_outside[key] = True
+
+async def fsub_joined(client, channel_id, user_id):
+    key = (channel_id, user_id)
+    if fsub_members.get(key):
+        return True
+    if fsub_outside.get(key):
+        return False
+    try:
+        member = await client.get_chat_member(channel_id, user_id)
+        joined = member.status not in (enums.ChatMemberStatus.LEFT, enums.ChatMemberStatus.BANNED)
+    except UserNotParticipant:
+        joined = False
+    fsub_update(channel_id, user_id, joined)
+    return joined
+
+async def fsub_invite(client, channel_id):
+    invite = fsub_invites.get(channel_id)
+    if invite is None:
+        async with fsub_invite_lock:
+            invite = fsub_invites.get(channel_id)
+            if invite is None:
+                chat = await client.get_chat(channel_id)
+                link = await client.create_chat_invite_link(channel_id, creates_join_request=True)
+                invite = fsub_invites[channel_id] = (chat.title, link.invite_link)
+    return invite
+
+async def fsub_missing(client, user_id):
+    """Returns (channel id, title, invite link) of every MULTI_FSUB channel the user hasn't joined.
+    Errors creating an invite link, like ChatAdminRequired, are left to the caller."""
+    missing = []
+    for channel_id in MULTI_FSUB:
+        try:
+            if await fsub_joined(client, channel_id, user_id):
+                continue
+        except Exception as e:
+            logger.warning(f"ForceSub Error: {e}")
+            continue
+        title, link = await fsub_invite(client, channel_id)
+        missing.append((channel_id, title, link))
+    return missing
+
 async def is_subscribed(bot, query, channels):
     btn = []
     for channel_id in channels:
@@ -66,37 +162,19 @@ async def is_subscribed(bot, query, channels):
             pass
     return btn
     
-async def get_poster(query, bulk=False, id=False, file=None):
-    if not id:
-        query = (query.strip()).lower()
-        title = query
-        year = re.findall(r'[1-2]\d{3}$', query, re.IGNORECASE)
-        if year:
-            year = list_to_str(year[:1])
-            title = (query.replace(year, "")).strip()
-        elif file is not None:
-            year = re.findall(r'[1-2]\d{3}', file, re.IGNORECASE)
-            if year:
-                year = list_to_str(year[:1]) 
-        else:
-            year = None
-        movieid = imdb.search_movie(title.lower(), results=10)
-        if not movieid:
-            return None
-        if year:
-            filtered=list(filter(lambda k: str(k.get('year')) == str(year), movieid))
-            if not filtered:
-                filtered = movieid
-        else:
-            filtered = movieid
-        movieid=list(filter(lambda k: k.get('kind') in ['movie', 'tv series'], filtered))
-        if not movieid:
-            movieid = filtered
-        if bulk:
-            return movieid
-        movieid = movieid[0].movieID
-    else:
-        movieid = query
+class ImdbResult(dict):
+    """A cached search hit, read like the Cinemagoer Movie objects callers used to get."""
+    @property
+    def movieID(self):
+        return self['movieID']
+
+def _search_imdb(title):
+    return [
+        {'movieID': movie.movieID, 'title': movie.get('title'), 'year': movie.get('year'), 'kind': movie.get('kind')}
+        for movie in imdb.search_movie(title, results=10)
+    ]
+
+def _get_movie(movieid):
     movie = imdb.get_movie(movieid)
     if movie.get("original air date"):
         date = movie["original air date"]
@@ -144,58 +222,149 @@ async def get_poster(query, bulk=False, id=False, file=None):
         'url':f'https://www.imdb.com/title/tt{movieid}'
     }
 
+async def _load_imdb(key, fetch, *args):
+    try:
+        cached = await db.get_imdb_cache(key)
+    except Exception as e:
+        logger.warning(f"IMDb cache read failed for {key}: {e}")
+        cached = None
+    if cached:
+        data = cached['data']
+        ttl = (cached['expire_at'] - datetime.utcnow()).total_seconds()
+    else:
+        # Cinemagoer scrapes over blocking HTTP, keep it off the event loop
+        data = await asyncio.get_running_loop().run_in_executor(imdb_pool, fetch, *args)
+        ttl = IMDB_CACHE_TIME if data else IMDB_NEGATIVE_CACHE_TIME
+        try:
+            await db.set_imdb_cache(key, data, ttl)
+        except Exception as e:
+            logger.warning(f"IMDb cache write failed for {key}: {e}")
+    imdb_memory[key] = (time.monotonic() + ttl, data)
+    imdb_memory.move_to_end(key)
+    while len(imdb_memory) > MAX_IMDB_MEMORY:
+        imdb_memory.popitem(last=False)
+    return data
+
+async def imdb_cached(key, fetch, *args):
+    """
+    Returns fetch(*args) through the memory and MongoDB caches. Misses are
+    cached too, and identical lookups running at the same time share one request.
+    """
+    cached = imdb_memory.get(key)
+    if cached and cached[0] > time.monotonic():
+        imdb_memory.move_to_end(key)
+        return cached[1]
+    task = imdb_pending.get(key)
+    if task is None:
+        task = imdb_pending[key] = asyncio.ensure_future(_load_imdb(key, fetch, *args))
+        task.add_done_callback(lambda _: imdb_pending.pop(key, None))
+    return await asyncio.shield(task)
+
+async def search_imdb(title):
+    title = ' '.join(title.lower().split())
+    return [ImdbResult(movie) for movie in await imdb_cached(f"search:{title}", _search_imdb, title) or []]
+
+async def get_poster(query, bulk=False, id=False, file=None):
+    if not id:
+        query = (query.strip()).lower()
+        title = query
+        year = re.findall(r'[1-2]\d{3}$', query, re.IGNORECASE)
+        if year:
+            year = list_to_str(year[:1])
+            title = (query.replace(year, "")).strip()
+        elif file is not None:
+            year = re.findall(r'[1-2]\d{3}', file, re.IGNORECASE)
+            if year:
+                year = list_to_str(year[:1]) 
+        else:
+            year = None
+        movieid = await search_imdb(title)
+        if not movieid:
+            return None
+        if year:
+            filtered=list(filter(lambda k: str(k.get('year')) == str(year), movieid))
+            if not filtered:
+                filtered = movieid
+        else:
+            filtered = movieid
+        movieid=list(filter(lambda k: k.get('kind') in ['movie', 'tv series'], filtered))
+        if not movieid:
+            movieid = filtered
+        if bulk:
+            return movieid
+        movieid = movieid[0].movieID
+    else:
+        movieid = query
+    movie = await imdb_cached(f"movie:{movieid}", _get_movie, movieid)
+    return dict(movie) if movie else None
+
+async def pin_broadcast(m, **kwargs):
+    # The copy already went out, a failed pin must never make the engine send it again
+    try:
+        await m.pin(**kwargs)
+    except FloodWait as e:
+        await asyncio.sleep(e.value)
+        try:
+            await m.pin(**kwargs)
+        except Exception:
+            pass
+    except Exception:
+        pass
+
 async def users_broadcast(user_id, message, is_pin):
+    # `message` was fetched by the bot sending it, copy goes out through that bot
     try:
-        m=await message.copy(chat_id=user_id)
+        m = await message.copy(chat_id=user_id)
         if is_pin:
-            await m.pin(both_sides=True)
-        return True, "Success"
-    except FloodWait as e:
-        await asyncio.sleep(e.x)
-        return await users_broadcast(user_id, message)
+            await pin_broadcast(m, both_sides=True)
+        return "Success"
+    except FloodWait:
+        # The broadcast engine backs every worker off, not just this send
+        raise
+    # Dead peers are only classified here, the broadcast job removes them in batches
     except InputUserDeactivated:
-        await db.delete_user(int(user_id))
-        logging.info(f"{user_id}-Removed from Database, since deleted account.")
-        return False, "Deleted"
+        return "Deleted"
     except UserIsBlocked:
-        logging.info(f"{user_id} -Blocked the bot.")
-        await db.delete_user(user_id)
-        return False, "Blocked"
+        return "Blocked"
     except PeerIdInvalid:
-        await db.delete_user(int(user_id))
-        logging.info(f"{user_id} - PeerIdInvalid")
-        return False, "Error"
+        return "Invalid"
     except Exception as e:
-        return False, "Error"
+        return "Error"
 
 async def groups_broadcast(chat_id, message, is_pin):
     try:
         m = await message.copy(chat_id=chat_id)
         if is_pin:
-            try:
-                await m.pin()
-            except:
-                pass
+            await pin_broadcast(m)
         return "Success"
-    except FloodWait as e:
-        await asyncio.sleep(e.x)
-        return await groups_broadcast(chat_id, message)
+    except FloodWait:
+        raise
+    except (ChannelPrivate, ChannelInvalid, ChatIdInvalid, PeerIdInvalid):
+        # The bot was removed or the chat is gone
+        return "Left"
     except Exception as e:
-        await db.delete_chat(chat_id)
         return "Error"
 
 async def get_settings(group_id , pm_mode = False):
     if pm_mode:
         return SETTINGS.copy()
-    else:
-        settings = await db.get_settings(group_id)
+    # Read-through cache, temp.SETTINGS maps group id -> (expires_at, settings)
+    group_id = int(group_id)
+    cached = temp.SETTINGS.get(group_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    settings = await db.get_settings(group_id)
+    cache_group_settings(group_id, settings)
     return settings 
-    
+
+def cache_group_settings(group_id, settings):
+    temp.SETTINGS[int(group_id)] = (time.monotonic() + SETTINGS_CACHE_TIME, settings)
+
 async def save_group_settings(group_id, key, value):
-    current = await get_settings(group_id)
+    current = dict(await get_settings(group_id))
     current.update({key: value})
-    temp.SETTINGS.update({group_id: current})
     await db.update_settings(group_id, current)
+    cache_group_settings(group_id, current)
 
 def get_size(size):
     units = ["Bytes", "KB", "MB", "GB", "TB", "PB", "EB"]
@@ -323,4 +492,4 @@ def get_readable_time(seconds):
 async def save_default_settings(id):
     await db.reset_group_settings(id)
     current = await db.get_settings(id)
-    temp.SETTINGS.update({id: current})
+    cache_group_settings(id, current)